@@ -0,0 +1,446 @@
+"""Benchmarks for represent.
+
+Run using ``nox -s benchmark``, or directly with ``python benchmarks/run.py``.
+Results are written as JSON so that runs can be compared, e.g. between
+releases:
+
+.. code-block:: bash
+
+    $ nox -s benchmark -- --output before.json
+    $ git checkout my-branch
+    $ nox -s benchmark -- --output after.json --compare before.json
+
+The ``threads/`` benchmarks measure repr throughput with 1 to ``--threads``
+threads. On free-threaded builds of Python (e.g. ``python3.13t``), the time
+per repr should fall as threads are added.
+"""
+
+import argparse
+import dataclasses
+import io
+import json
+import os
+import platform
+import re
+import reprlib
+import statistics
+import subprocess
+import sys
+import threading
+import timeit
+from importlib.metadata import version
+from time import perf_counter_ns
+
+from IPython.lib.pretty import pretty
+from rich.pretty import pretty_repr
+
+from represent import (
+    PrettyReprHelper,
+    ReprHelper,
+    ReprHelperMixin,
+    RichReprHelper,
+    autorepr,
+    fingerprint,
+    key,
+    repr_bytes,
+    repr_many,
+    to_dict,
+    write_json_lines,
+)
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a function returning the zero-argument callable to time."""
+
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+ARGS = (42, "name", 3.5, [1, 2, 3])
+
+
+class HandWritten:
+    def __init__(self, a, b, c, d):
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(a={self.a!r}, b={self.b!r}, "
+            f"c={self.c!r}, d={self.d!r})"
+        )
+
+
+@dataclasses.dataclass
+class DataClass:
+    a: int
+    b: str
+    c: float
+    d: list
+
+
+@autorepr
+class AutoRepr:
+    def __init__(self, a, b, c, d):
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+
+
+class HelperMixin(ReprHelperMixin):
+    def __init__(self, a, b, c, d):
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+
+    def _repr_helper_(self, r):
+        r.keyword_from_attr("a")
+        r.keyword_from_attr("b")
+        r.keyword_from_attr("c")
+        r.keyword_from_attr("d")
+
+
+class TracedHelperMixin(HelperMixin, trace=True):
+    pass
+
+
+class ManualHelpers(HandWritten):
+    def _repr_helper(self, r):
+        r.keyword_from_attr("a")
+        r.keyword_from_attr("b")
+        r.keyword_from_attr("c")
+        r.keyword_from_attr("d")
+
+    def __repr__(self):
+        r = ReprHelper(self)
+        self._repr_helper(r)
+        return str(r)
+
+    def _repr_pretty_(self, p, cycle):
+        with PrettyReprHelper(self, p, cycle) as r:
+            self._repr_helper(r)
+
+    def __rich_repr__(self):
+        r = RichReprHelper(self)
+        self._repr_helper(r)
+        yield from r
+
+
+@autorepr
+class Node:
+    def __init__(self, value, children):
+        self.value = value
+        self.children = children
+
+
+def make_tree(depth, width):
+    if depth == 0:
+        return Node(0, [])
+    return Node(depth, [make_tree(depth - 1, width) for _ in range(width)])
+
+
+for name, cls in [
+    ("baseline/hand-written", HandWritten),
+    ("baseline/dataclass", DataClass),
+    ("autorepr", AutoRepr),
+    ("mixin", HelperMixin),
+    ("mixin-traced", TracedHelperMixin),
+    ("manual-helpers", ManualHelpers),
+]:
+    obj = cls(*ARGS)
+    benchmark(f"repr/{name}")(lambda obj=obj: lambda: repr(obj))
+    if name != "baseline/hand-written" and name != "baseline/dataclass":
+        benchmark(f"pretty/{name}")(lambda obj=obj: lambda: pretty(obj))
+        benchmark(f"rich/{name}")(lambda obj=obj: lambda: pretty_repr(obj))
+
+
+def _many_options(omit_defaults):
+    """Create a class with 20 optional arguments."""
+    params = "".join(f", option{i}=None" for i in range(20))
+    lines = [f"def __init__(self, name{params}):", "    self.name = name"]
+    lines.extend(f"    self.option{i} = option{i}" for i in range(20))
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    cls = type("ManyOptions", (), {"__init__": namespace["__init__"]})
+    return autorepr(omit_defaults=omit_defaults)(cls)
+
+
+@benchmark("repr/many-options")
+def _():
+    obj = _many_options(False)("name", option3=1)
+    return lambda: repr(obj)
+
+
+@benchmark("repr/many-options-omit-defaults")
+def _():
+    obj = _many_options(True)("name", option3=1)
+    return lambda: repr(obj)
+
+
+@benchmark("repr/baseline/reprlib")
+def _():
+    obj = HandWritten(*ARGS)
+    return lambda: reprlib.repr(obj)
+
+
+@benchmark("repr/autorepr-tree")
+def _():
+    tree = make_tree(4, 4)
+    return lambda: repr(tree)
+
+
+@benchmark("repr/autorepr-nested")
+def _():
+    leaf = AutoRepr(*ARGS)
+    obj = AutoRepr(leaf, leaf, [leaf] * 3, {1: leaf})
+    return lambda: repr(obj)
+
+
+@benchmark("repr/list")
+def _():
+    objs = [AutoRepr(*ARGS) for _ in range(1000)]
+    return lambda: repr(objs)
+
+
+@benchmark("repr/baseline/encode")
+def _():
+    tree = make_tree(4, 4)
+    return lambda: repr(tree).encode()
+
+
+@benchmark("repr/repr_bytes")
+def _():
+    tree = make_tree(4, 4)
+    return lambda: repr_bytes(tree)
+
+
+@benchmark("repr/repr_many")
+def _():
+    objs = [AutoRepr(*ARGS) for _ in range(1000)]
+    return lambda: repr_many(objs)
+
+
+@benchmark("key/baseline/hash-repr")
+def _():
+    tree = make_tree(4, 4)
+    return lambda: hash(repr(tree))
+
+
+@benchmark("key/key")
+def _():
+    tree = make_tree(4, 4)
+    return lambda: hash(key(tree))
+
+
+@benchmark("key/fingerprint")
+def _():
+    tree = make_tree(4, 4)
+    return lambda: fingerprint(tree)
+
+
+@benchmark("structured/to_dict")
+def _():
+    obj = AutoRepr(*ARGS)
+    return lambda: to_dict(obj)
+
+
+@benchmark("structured/json-lines")
+def _():
+    objs = [AutoRepr(*ARGS) for _ in range(1000)]
+    return lambda: write_json_lines(objs, io.StringIO())
+
+
+def _init(self, a, b, c, d):
+    pass
+
+
+@benchmark("decorate/baseline/class")
+def _():
+    return lambda: type("A", (), {"__init__": _init})
+
+
+@benchmark("decorate/autorepr")
+def _():
+    return lambda: autorepr(type("A", (), {"__init__": _init}))
+
+
+@benchmark("decorate/mixin-traced")
+def _():
+    def _repr_helper_(self, r):
+        r.keyword_from_attr("a")
+
+    namespace = {"__init__": _init, "_repr_helper_": _repr_helper_}
+    return lambda: type("A", (ReprHelperMixin,), namespace, trace=True)
+
+
+def time_callable(func, repeat):
+    """Return the best time per call in nanoseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+# Objects shown by each thread in the threads/ benchmarks. Each thread has
+# its own instances, so only the state shared by the class is contended.
+THREADED = {
+    "autorepr": lambda: AutoRepr(*ARGS),
+    "mixin": lambda: HelperMixin(*ARGS),
+    "mixin-traced": lambda: TracedHelperMixin(*ARGS),
+    "autorepr-tree": lambda: make_tree(2, 4),
+}
+
+
+def time_threads(make_obj, n_threads, repeat, calls=20_000):
+    """Return the wall time in nanoseconds divided by the total number of
+    reprs, when `n_threads` threads each call :func:`repr` `calls` times.
+    """
+    best = None
+    for _ in range(repeat):
+        barrier = threading.Barrier(n_threads + 1)
+
+        def work(obj):
+            barrier.wait()
+            for _ in range(calls):
+                repr(obj)
+
+        threads = [
+            threading.Thread(target=work, args=(make_obj(),)) for _ in range(n_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = perf_counter_ns()
+        for thread in threads:
+            thread.join()
+        elapsed = (perf_counter_ns() - start) / (n_threads * calls)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def thread_counts(max_threads):
+    """Return 1, 2, 4, ... up to and including `max_threads`."""
+    counts = []
+    n = 1
+    while n < max_threads:
+        counts.append(n)
+        n *= 2
+    counts.append(max_threads)
+    return counts
+
+
+def _gil_enabled():
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+IMPORTS = {
+    "import/represent": "import represent",
+    "import/autorepr": "from represent import autorepr",
+    "import/all": "from represent import *",
+}
+
+# Only top-level lines, nested imports are indented.
+_IMPORTTIME_RE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S+)$")
+
+
+def _import_times(statement):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            times[match.group(2)] = int(match.group(1)) * 1000
+    return times
+
+
+def time_import(statement, repeat):
+    """Return the median time in nanoseconds taken by the imports in
+    `statement`, as reported by ``python -X importtime``.
+    """
+    startup = set(_import_times("pass"))
+    times = []
+    for _ in range(repeat):
+        imported = _import_times(statement)
+        times.append(sum(t for name, t in imported.items() if name not in startup))
+    return statistics.median(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of results to compare with")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="maximum number of threads for the threads/ benchmarks",
+    )
+    parser.add_argument(
+        "-k", dest="pattern", help="only run benchmarks containing this string"
+    )
+    args = parser.parse_args(argv)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)["results"]
+
+    threaded = {
+        f"threads/{case}/{n}": (make_obj, n)
+        for case, make_obj in THREADED.items()
+        for n in thread_counts(args.threads)
+    }
+
+    results = {}
+    names = sorted(BENCHMARKS) + list(threaded) + list(IMPORTS)
+    for name in names:
+        if args.pattern and args.pattern not in name:
+            continue
+        if name in IMPORTS:
+            ns = time_import(IMPORTS[name], args.repeat)
+        elif name in threaded:
+            ns = time_threads(*threaded[name], args.repeat)
+        else:
+            ns = time_callable(BENCHMARKS[name](), args.repeat)
+        results[name] = ns
+
+        line = f"{name:<40} {ns:>12.1f} ns"
+        if name in threaded:
+            single = results.get(name.rsplit("/", 1)[0] + "/1")
+            if single is not None:
+                line += f"  [{single / ns:.2f}x throughput]"
+        if name in previous:
+            line += f"  ({ns / previous[name]:.2f}x)"
+        print(line, flush=True)
+
+    if args.output:
+        data = {
+            "represent": version("represent"),
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "gil": _gil_enabled(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,3 +19,9 @@ def tests(session: nox.Session) -> None:
 def docs(session: nox.Session) -> None:
     session.run_install("uv", "sync", "--no-default-groups", "--group=docs")
     session.run("sphinx-build", "-W", "-b", "html", "docs", "docs/_build/html")
+
+
+@nox.session
+def benchmark(session: nox.Session) -> None:
+    session.run_install("uv", "sync", "--no-default-groups", "--group=test")
+    session.run("python", "benchmarks/run.py", *session.posargs)
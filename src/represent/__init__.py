@@ -1,4 +1,69 @@
-from .core import *  # noqa: F403
-from .helper import *  # noqa: F403
+from importlib import import_module
 
-__all__ = core.__all__ + helper.__all__  # noqa: F405
+# Names are imported from their module when first accessed (PEP 562), so
+# that e.g. importing autorepr doesn't also import logging and
+# multiprocessing.
+_MODULES = {
+    "summarize_arrays": "arrays",
+    "BoundedReprHelper": "bounded",
+    "bounded_repr": "bounded",
+    "clear_repr_cache": "cache",
+    "ReprHelperMixin": "core",
+    "autorepr": "core",
+    "register_formatter": "formatters",
+    "unregister_formatter": "formatters",
+    "ReprHelper": "helper",
+    "PrettyReprHelper": "helper",
+    "RichReprHelper": "helper",
+    "DictReprHelper": "helper",
+    "ReprStats": "instrumentation",
+    "disable_stats": "instrumentation",
+    "enable_stats": "instrumentation",
+    "reset_stats": "instrumentation",
+    "stats": "instrumentation",
+    "fingerprint": "keys",
+    "key": "keys",
+    "LazyRepr": "log",
+    "LazyReprFilter": "log",
+    "lazy": "log",
+    "repr_bytes": "output",
+    "repr_bytes_into": "output",
+    "repr_many": "output",
+    "write_repr": "output",
+    "write_repr_bytes": "output",
+    "write_repr_parallel": "parallel",
+    "json_default": "structured",
+    "to_dict": "structured",
+    "write_json_lines": "structured",
+}
+
+_SUBMODULES = {*_MODULES.values(), "utilities"}
+
+# The other names are also available from the package, but only these are
+# exported by `from represent import *`.
+__all__ = [
+    "ReprHelperMixin",
+    "autorepr",
+    "ReprHelper",
+    "PrettyReprHelper",
+    "RichReprHelper",
+]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # Importing a submodule also sets it as an attribute of the package.
+        return import_module(f".{name}", __name__)
+
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES) | _SUBMODULES)
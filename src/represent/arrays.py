@@ -0,0 +1,62 @@
+from functools import partial
+
+from .formatters import register_formatter
+
+__all__ = ["summarize_arrays"]
+
+_EDGE_ITEMS = 3
+
+
+def summarize_arrays(threshold=100):
+    """Show NumPy arrays with more than `threshold` elements as a summary in
+    the output of :func:`~represent.core.autorepr`,
+    :class:`~represent.core.ReprHelperMixin`, and the helpers, e.g.
+
+    .. code-block:: none
+
+        Samples(data=<ndarray shape=(1000, 3) dtype=float64 min=-3.21 max=3.43
+        mean=0.0012 [0.4967, -0.1383, 0.6477, ..., 1.517, -0.2321, -0.2326]>)
+
+    Smaller arrays are shown using their usual repr. The summary is
+    registered using :func:`~represent.formatters.register_formatter`, so it
+    can be removed with :code:`unregister_formatter(numpy.ndarray)`.
+
+    NumPy is only imported when this function is called.
+
+    .. versionadded:: 2.3.0
+    """
+    import numpy
+
+    register_formatter(numpy.ndarray, partial(_summarize, threshold=threshold))
+
+
+def _summarize(array, threshold):
+    if array.size <= threshold or not array.size:
+        return repr(array)
+
+    parts = [f"<{type(array).__name__} shape={array.shape!r} dtype={array.dtype}"]
+    if array.dtype.kind in "iuf":
+        # Each reduction is vectorized and doesn't copy the array.
+        parts.append(f"min={_format_item(array.min().item())}")
+        parts.append(f"max={_format_item(array.max().item())}")
+        parts.append(f"mean={_format_item(array.mean().item())}")
+
+    # Unlike reshape, flat doesn't copy non-contiguous arrays.
+    if array.size <= 2 * _EDGE_ITEMS:
+        items = ", ".join(map(_format_item, array.flat[:].tolist()))
+    else:
+        head = ", ".join(map(_format_item, array.flat[:_EDGE_ITEMS].tolist()))
+        tail = ", ".join(map(_format_item, array.flat[-_EDGE_ITEMS:].tolist()))
+        items = f"{head}, ..., {tail}"
+    parts.append(f"[{items}]>")
+    return " ".join(parts)
+
+
+def _format_item(value):
+    if isinstance(value, float):
+        text = f"{value:.4g}"
+        # Keep floats distinguishable from integers, e.g. 1.0 rather than 1
+        if not any(c in text for c in ".ein"):
+            text += ".0"
+        return text
+    return repr(value)
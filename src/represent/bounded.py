@@ -0,0 +1,293 @@
+import reprlib
+import sys
+from itertools import islice
+
+from .formatters import find_formatter, registry
+from .helper import ReprHelper
+from .utilities import inherit_docstrings, is_default
+
+__all__ = ["BoundedReprHelper", "bounded_repr"]
+
+
+def bounded_repr(obj, max_length=None, max_depth=None):
+    """Return a repr of `obj` limited in length and nesting depth.
+
+    Objects using :func:`~represent.core.autorepr` or
+    :class:`~represent.core.ReprHelperMixin` are rendered field by field, and
+    once `max_length` characters have been produced, the remaining fields are
+    replaced by ``...`` without being evaluated. Other values are shortened
+    like :mod:`reprlib`, with limits derived from the remaining budget, and
+    the items of lists, tuples, sets, and dicts are shown until it is spent.
+
+    The limit on length is approximate, because closing brackets and
+    keywords are always shown.
+
+    :param int max_length: Approximate maximum number of characters.
+    :param int max_depth: Maximum depth of nested containers and objects.
+        Deeper values are shown as e.g. ``[...]`` or ``A(...)``.
+
+    .. versionadded:: 2.3.0
+    """
+    return _BoundedRepr(max_length, max_depth).repr(obj)
+
+
+class _BoundedRepr(reprlib.Repr):
+    """:class:`reprlib.Repr` sharing a character budget between all the values
+    it renders, which knows how to render represent objects.
+    """
+
+    # Set by reprlib.Repr itself from Python 3.11.
+    fillvalue = "..."
+
+    def __init__(self, max_length=None, max_depth=None):
+        super().__init__()
+        self.max_length = max_length
+        self.remaining = max_length
+        self.maxlevel = sys.maxsize if max_depth is None else max_depth
+        self._active = set()
+        self._set_limits(sys.maxsize if max_length is None else max_length)
+
+    def _set_limits(self, n):
+        n = max(n, 0)
+        self.maxstring = self.maxother = self.maxlong = max(n, 3)
+        # Each item needs at least two characters, so this many items will
+        # always exhaust the budget.
+        self.maxtuple = self.maxlist = self.maxarray = n // 2 + 1
+        self.maxdict = self.maxset = self.maxfrozenset = self.maxdeque = n // 2 + 1
+
+    def exhausted(self):
+        return self.remaining is not None and self.remaining <= 0
+
+    def charge(self, n):
+        if self.remaining is not None:
+            self.remaining -= n
+
+    def truncate(self, text):
+        """Shorten `text`, which was not produced by this instance, to fit in
+        the remaining budget.
+        """
+        n = max(self.remaining, 3) if self.remaining is not None else None
+        if n is None or len(text) <= n:
+            return text
+        return text[: n - 3] + "..."
+
+    def repr_field(self, value, level):
+        """Render `value` with limits set from the remaining budget.
+
+        The caller is responsible for charging the length of the result.
+        """
+        before = self.remaining
+        if before is None:
+            return self.repr1(value, level)
+
+        self._set_limits(before)
+        try:
+            return self.repr1(value, level)
+        finally:
+            # Nested objects charge as they go so they know when to stop,
+            # but the caller charges for the whole result.
+            self.remaining = before
+
+    def repr1(self, x, level):
+        if registry:
+            func = find_formatter(type(x))
+            if func is not None:
+                return self.truncate(func(x))
+        key = id(x)
+        if key in self._active:
+            return "..."
+        self._active.add(key)
+        try:
+            return super().repr1(x, level)
+        finally:
+            self._active.discard(key)
+
+    def _repr_iterable(self, x, level, left, right, maxiter, trail=""):
+        if self.remaining is None:
+            return super()._repr_iterable(x, level, left, right, maxiter, trail)
+        n = len(x)
+        if level <= 0 and n:
+            return f"{left}{self.fillvalue}{right}"
+        if n == 1 and trail:
+            right = trail + right
+        pieces = self._repr_pieces(
+            ([item] for item in islice(x, maxiter)), n > maxiter, level - 1
+        )
+        return left + ", ".join(pieces) + right
+
+    def repr_dict(self, x, level):
+        if self.remaining is None or not x or level <= 0:
+            return super().repr_dict(x, level)
+        items = islice(reprlib._possibly_sorted(x), self.maxdict)
+        pieces = self._repr_pieces(
+            ([key, x[key]] for key in items), len(x) > self.maxdict, level - 1
+        )
+        return "{" + ", ".join(pieces) + "}"
+
+    def _repr_pieces(self, items, truncated, level):
+        """Return the reprs of the values in each of `items`, joined by
+        ``': '``, stopping with ``...`` once the budget is spent.
+
+        Each value is limited by the budget remaining after the previous
+        ones, so that containers of long values don't exceed it.
+        """
+        pieces = []
+        for values in items:
+            if self.exhausted():
+                truncated = True
+                break
+            parts = []
+            for value in values:
+                # Nested containers charge as they go, so charge from the
+                # budget before this value.
+                before = self.remaining
+                self._set_limits(before)
+                parts.append(self.repr1(value, level))
+                self.remaining = before - len(parts[-1]) - 2
+            pieces.append(": ".join(parts))
+        if truncated:
+            pieces.append(self.fillvalue)
+        return pieces
+
+    def repr_instance(self, x, level):
+        cls = type(x)
+        if getattr(cls.__repr__, "_represent_generated", False):
+            return self._repr_represent(x, level)
+        return super().repr_instance(x, level)
+
+    def _repr_represent(self, x, level):
+        from .core import _represent_info
+
+        cls = type(x)
+        info = _represent_info(cls)
+
+        if level <= 0:
+            left, right = info.parantheses if info is not None else "()"
+            return f"{cls.__name__}{left}...{right}"
+
+        safe = getattr(cls, "_represent_safe", False)
+        r = BoundedReprHelper._from_engine(x, self, level, safe)
+        if info is not None:
+            r.parantheses = info.parantheses
+            for attr in info.args:
+                r.positional_from_attr(attr)
+            defaults = info.defaults or {}
+            for keyword, attr in info.kw:
+                if attr in defaults:
+                    value = r._getattr(attr)
+                    if not is_default(value, defaults[attr]):
+                        r.keyword_with_value(keyword, value)
+                else:
+                    r.keyword_from_attr(keyword, attr)
+        else:
+            x._repr_helper_(r)
+        return str(r)
+
+
+@inherit_docstrings
+class BoundedReprHelper(ReprHelper):
+    """Help manual construction of a :code:`__repr__` limited in length and
+    nesting depth.
+
+    It should be used as follows:
+
+    .. code-block:: python
+
+        def __repr__(self)
+            r = BoundedReprHelper(self, max_length=200)
+            r.keyword_from_attr('name')
+            return str(r)
+
+    Once `max_length` characters have been produced, further arguments are
+    replaced by ``...`` and their attributes are not read. See
+    :func:`~represent.bounded.bounded_repr` for details.
+
+    If `safe` is true, attributes are read without side effects, see
+    :class:`~represent.helper.ReprHelper`. Exceptions raised by the repr of
+    values are always handled, like :mod:`reprlib`.
+
+    .. versionadded:: 2.3.0
+    """
+
+    __slots__ = ("_engine", "_level", "_truncated")
+
+    def __init__(self, other, max_length=None, max_depth=None, safe=False):
+        engine = _BoundedRepr(max_length, max_depth)
+        self._init_bounded(other, engine, engine.maxlevel, safe)
+
+    @classmethod
+    def _from_engine(cls, other, engine, level, safe=False):
+        self = cls.__new__(cls)
+        self._init_bounded(other, engine, level, safe)
+        return self
+
+    def _init_bounded(self, other, engine, level, safe):
+        super().__init__(other, safe)
+        self._engine = engine
+        self._level = level
+        self._truncated = False
+        engine.charge(len(self.other_cls.__name__) + 2)
+
+    def reset(self, other):
+        super().reset(other)
+        self._engine.remaining = self._engine.max_length
+        self._truncated = False
+        self._engine.charge(len(self.other_cls.__name__) + 2)
+
+    def positional_from_attr(self, attr_name):
+        if self.keyword_started:
+            raise ValueError("positional arguments cannot follow keyword arguments")
+        if self._budget_spent():
+            return
+        value = self._engine.repr_field(self._getattr(attr_name), self._level - 1)
+        self._add(None, value)
+
+    def positional_with_value(self, value, raw=False):
+        if self.keyword_started:
+            raise ValueError("positional arguments cannot follow keyword arguments")
+        if self._budget_spent():
+            return
+        if raw:
+            value = self._engine.truncate(str(value))
+        else:
+            value = self._engine.repr_field(value, self._level - 1)
+        self._add(None, value)
+
+    def keyword_from_attr(self, name, attr_name=None):
+        self.keyword_started = True
+        if self._budget_spent():
+            return
+        self._engine.charge(len(name) + 1)
+        attr_name = attr_name or name
+        value = self._engine.repr_field(self._getattr(attr_name), self._level - 1)
+        self._add(name, value)
+
+    def keyword_with_value(self, name, value, raw=False):
+        self.keyword_started = True
+        if self._budget_spent():
+            return
+        self._engine.charge(len(name) + 1)
+        if raw:
+            value = self._engine.truncate(str(value))
+        else:
+            value = self._engine.repr_field(value, self._level - 1)
+        self._add(name, value)
+
+    def _add(self, name, value):
+        self._engine.charge(len(value) + 2 * bool(self.iarg))
+        self._ensure_comma()
+        self.repr_parts.append(value if name is None else f"{name}={value}")
+        self.iarg += 1
+
+    def _budget_spent(self):
+        """Return True if no more arguments should be rendered, adding
+        ``...`` in place of the first one that is skipped.
+        """
+        if not self._engine.exhausted():
+            return False
+        if not self._truncated:
+            self._truncated = True
+            self._ensure_comma()
+            self.repr_parts.append("...")
+            self.iarg += 1
+        return True
@@ -0,0 +1,115 @@
+from _thread import allocate_lock
+from weakref import ref
+
+from . import formatters
+from .utilities import running_reprs
+
+__all__ = ["clear_repr_cache"]
+
+# id(obj) -> (weak reference to obj, repr)
+_cache = {}
+
+# id(obj) -> (obj, repr) for instances which don't support weak references,
+# e.g. classes with __slots__. The entries keep the objects alive, so that
+# their ids can't be reused while cached, and the oldest is evicted once there
+# are _STRONG_CACHE_SIZE.
+_strong_cache = {}
+
+_STRONG_CACHE_SIZE = 4096
+
+# Guards eviction, so that threads don't evict the same entry.
+_strong_lock = allocate_lock()
+
+
+def clear_repr_cache(obj=None):
+    """Forget the cached repr of `obj`, or of every object if `obj` is not
+    given.
+
+    This is only needed for classes using ``cache=True`` whose instances are
+    mutated after their repr has been computed, or to release instances
+    which don't support weak references, which are kept alive by the cache.
+    The cache is cleared automatically when formatters are registered or
+    unregistered.
+
+    .. versionadded:: 2.3.0
+    """
+    if obj is None:
+        _cache.clear()
+        _strong_cache.clear()
+        return
+
+    entry = _cache.get(id(obj))
+    if entry is not None and entry[0]() is obj:
+        del _cache[id(obj)]
+
+    entry = _strong_cache.get(id(obj))
+    if entry is not None and entry[0] is obj:
+        _strong_cache.pop(id(obj), None)
+
+
+# Cached reprs may have been shown using formatters which have changed.
+formatters.listeners.append(clear_repr_cache)
+
+
+def _get_weak(obj):
+    entry = _cache.get(id(obj))
+    if entry is not None and entry[0]() is obj:
+        return entry[1]
+    return None
+
+
+def _set_weak(obj, value):
+    key = id(obj)
+
+    def remove(wr):
+        # Only remove our own entry, the id may have been reused.
+        if _cache.get(key, (None,))[0] is wr:
+            # Another thread may have removed it already.
+            _cache.pop(key, None)
+
+    _cache[key] = (ref(obj, remove), value)
+
+
+def _get_strong(obj):
+    # The entry keeps obj alive, so an entry for its id must be for obj.
+    entry = _strong_cache.get(id(obj))
+    if entry is not None:
+        return entry[1]
+    return None
+
+
+def _set_strong(obj, value):
+    with _strong_lock:
+        if len(_strong_cache) >= _STRONG_CACHE_SIZE:
+            del _strong_cache[next(iter(_strong_cache))]
+        _strong_cache[id(obj)] = (obj, value)
+
+
+def cached_repr_into(cls, repr_into):
+    """Wrap the :code:`__repr_into__` method `repr_into` of `cls` so that the
+    repr of each instance is only computed once.
+
+    Reprs which hit a recursive reference aren't cached, because the output
+    depends on where the recursion started.
+    """
+    if cls.__weakrefoffset__:
+        get, set_ = _get_weak, _set_weak
+    else:
+        get, set_ = _get_strong, _set_strong
+
+    def __repr_into__(self, buffer):
+        value = get(self)
+        if value is None:
+            parts = []
+            running = running_reprs()
+            fills = running.fills
+            repr_into(self, parts)
+            value = "".join(parts)
+            if running.fills == fills:
+                set_(self, value)
+        buffer.append(value)
+
+    __repr_into__.__qualname__ = f"{cls.__qualname__}.__repr_into__"
+    __repr_into__.__module__ = cls.__module__
+    __repr_into__._represent_generated = True
+    return __repr_into__
@@ -1,9 +1,33 @@
-import inspect
-from functools import partial
-from reprlib import recursive_repr
-
-from .helper import PrettyReprHelper, ReprHelper, RichReprHelper
-from .utilities import ReprInfo
+from _thread import RLock
+from collections import namedtuple
+from functools import cache, partial
+from keyword import iskeyword
+from types import FunctionType
+
+from . import formatters, instrumentation
+from .bounded import bounded_repr
+from .cache import cached_repr_into
+from .helper import (
+    BaseReprHelper,
+    PrettyReprHelper,
+    ReprHelper,
+    RichReprHelper,
+    pretty_value,
+    rich_value,
+    safe_pretty_value,
+)
+from .utilities import (
+    ATOMIC_TYPES,
+    Parantheses,
+    ReprInfo,
+    is_plain,
+    recursive_repr,
+    recursive_repr_into,
+    repr_into,
+    repr_into_method,
+    safe_getattr,
+    safe_repr_into,
+)
 
 __all__ = ["ReprHelperMixin", "autorepr"]
 
@@ -11,6 +35,12 @@ __all__ = ["ReprHelperMixin", "autorepr"]
 _DEFAULT_INCLUDE_PRETTY = True
 _DEFAULT_INCLUDE_RICH = True
 
+# Held while methods are compiled or replaced, so that on free-threaded
+# builds each class is compiled once and methods compiled for a stale set of
+# formatters aren't installed. Reprs themselves don't use it. (_thread rather
+# than threading, which is slower to import.)
+_compile_lock = RLock()
+
 
 def autorepr(*args, **kwargs):
     """Class decorator to construct :code:`__repr__` **automatically**
@@ -27,6 +57,25 @@ def autorepr(*args, **kwargs):
     :param include_pretty: Add a ``_repr_pretty_`` to the class (defaults to
         True).
     :param include_rich: Add a ``__rich_repr__`` to the class (defaults to True).
+    :param max_length: Limit the length of ``__repr__``, see
+        :func:`~represent.bounded.bounded_repr`.
+    :param max_depth: Limit the nesting depth of ``__repr__``, see
+        :func:`~represent.bounded.bounded_repr`.
+    :param cache: Compute ``__repr__`` once per instance (defaults to False).
+        Only use this if instances (and the attributes shown) are immutable,
+        or call :func:`~represent.cache.clear_repr_cache` after changes.
+        Instances which don't support weak references (classes with
+        ``__slots__`` without ``'__weakref__'``) are kept alive by the cache,
+        along with everything they reference, until 4096 newer instances
+        have been cached or the cache is cleared.
+    :param safe: Read attributes from the instance :code:`__dict__` or slots
+        only, without calling properties or other descriptors, and handle
+        exceptions raised by the repr of values (defaults to False). See
+        :class:`~represent.helper.ReprHelper`.
+    :param omit_defaults: Omit keyword arguments whose value is the default
+        value of the parameter in ``__init__``, recorded when the class is
+        decorated (defaults to False). Values are compared by identity, then
+        by type and equality.
 
     Example:
 
@@ -53,8 +102,17 @@ def autorepr(*args, **kwargs):
             A(1, b=2)
 
     .. versionadded:: 1.5.0
+
+    Subclasses show the arguments to their own ``__init__``. The methods for
+    each class are compiled when they are first used.
+
+    .. versionchanged:: 2.3.0
+        `max_length`, `max_depth`, `cache`, `safe`, and `omit_defaults`
+        arguments added.
+        Subclasses no longer show the arguments to the base class's ``__init__``.
     """
-    cls = positional = None
+    cls = positional = max_length = max_depth = None
+    cache = safe = omit_defaults = False
     include_pretty = _DEFAULT_INCLUDE_PRETTY
     include_rich = _DEFAULT_INCLUDE_RICH
 
@@ -74,7 +132,16 @@ def autorepr(*args, **kwargs):
             )
 
     elif not args and kwargs:
-        valid_kwargs = {"positional", "include_pretty", "include_rich"}
+        valid_kwargs = {
+            "positional",
+            "include_pretty",
+            "include_rich",
+            "max_length",
+            "max_depth",
+            "cache",
+            "safe",
+            "omit_defaults",
+        }
         invalid_kwargs = set(kwargs) - valid_kwargs
 
         if invalid_kwargs:
@@ -84,85 +151,120 @@ def autorepr(*args, **kwargs):
         positional = kwargs.get("positional")
         include_pretty = kwargs.get("include_pretty", include_pretty)
         include_rich = kwargs.get("include_rich", include_rich)
+        max_length = kwargs.get("max_length")
+        max_depth = kwargs.get("max_depth")
+        cache = kwargs.get("cache", cache)
+        safe = kwargs.get("safe", safe)
+        omit_defaults = kwargs.get("omit_defaults", omit_defaults)
 
     elif (args and kwargs) or (not args and not kwargs):
         raise TypeError("Use bare @autorepr or @autorepr(...) with keyword args.")
 
-    # Define the methods we'll add to the decorated class.
-
-    @recursive_repr()
-    def __repr__(self):
-        return self.__class__._represent.fstr.format(self=self)
-
-    repr_pretty = rich_repr = None
-    if include_pretty:
-        repr_pretty = _make_repr_pretty()
-    if include_rich:
-        rich_repr = _make_rich_repr()
-
     if cls is not None:
-        return _autorepr_decorate(
-            cls, repr=__repr__, repr_pretty=repr_pretty, rich_repr=rich_repr
-        )
+        return _autorepr_decorate(cls)
     else:
         return partial(
             _autorepr_decorate,
-            repr=__repr__,
-            repr_pretty=repr_pretty,
-            rich_repr=rich_repr,
             positional=positional,
             include_pretty=include_pretty,
             include_rich=include_rich,
+            max_length=max_length,
+            max_depth=max_depth,
+            cache=cache,
+            safe=safe,
+            omit_defaults=omit_defaults,
         )
 
 
-def _make_repr_pretty():
-    def _repr_pretty_(self, p, cycle):
-        """Pretty printer for :class:`IPython.lib.pretty`"""
-        cls = self.__class__
-        clsname = cls.__name__
-
-        if cycle:
-            p.text(f"{clsname}(...)")
-        else:
-            positional_args = cls._represent.args
-            keyword_args = cls._represent.kw
-
-            with p.group(len(clsname) + 1, clsname + "(", ")"):
-                for i, positional in enumerate(positional_args):
-                    if i:
-                        p.text(",")
-                        p.breakable()
-                    p.pretty(getattr(self, positional))
-
-                for i, keyword in enumerate(keyword_args, start=len(positional_args)):
-                    if i:
-                        p.text(",")
-                        p.breakable()
-                    with p.group(len(keyword) + 1, keyword + "="):
-                        p.pretty(getattr(self, keyword))
+# Flags from inspect, which is slow to import.
+_CO_VARARGS = 0x04
+_CO_VARKEYWORDS = 0x08
 
-    return _repr_pretty_
 
+def _getparams(cls):
+    """Return the parameter names of `cls` in the same order as
+    :func:`inspect.signature`, and the set of keyword only parameters.
+    """
+    init = _plain_init(cls)
+    if init is not None:
+        return _code_params(init.__code__)
+    return _inspect_params(cls)
 
-def _make_rich_repr():
-    def __rich_repr__(self):
-        """Pretty printer for :mod:`rich.pretty`"""
-        cls = self.__class__
-
-        positional_args = cls._represent.args
-        keyword_args = cls._represent.kw
-
-        for positional in positional_args:
-            yield getattr(self, positional)
 
-        for keyword in keyword_args:
-            yield keyword, getattr(self, keyword)
+def _plain_init(cls):
+    """Return the :code:`__init__` function which determines the signature
+    of `cls`, or None if it can't be read directly from its code object.
+    """
+    if type(cls).__call__ is not type.__call__ or hasattr(cls, "__signature__"):
+        return None
+
+    for base in cls.__mro__:
+        namespace = vars(base)
+        if "__new__" in namespace:
+            return None
+        if "__init__" in namespace:
+            init = namespace["__init__"]
+            if (
+                type(init) is FunctionType
+                and init.__code__.co_argcount
+                and not hasattr(init, "__wrapped__")
+                and not hasattr(init, "__signature__")
+            ):
+                return init
+            return None
+    return None
+
+
+@cache
+def _code_params(code):
+    names = code.co_varnames
+    nargs = code.co_argcount
+    nkwonly = code.co_kwonlyargcount
+
+    # Skip self
+    params = list(names[1:nargs])
+    kwonly = names[nargs : nargs + nkwonly]
+    i = nargs + nkwonly
+    if code.co_flags & _CO_VARARGS:
+        params.append(names[i])
+        i += 1
+    params.extend(kwonly)
+    if code.co_flags & _CO_VARKEYWORDS:
+        params.append(names[i])
+
+    return tuple(params), frozenset(kwonly)
+
+
+def _getdefaults(cls):
+    """Return a dict mapping the parameters of `cls` which have a default
+    value to that value.
+    """
+    init = _plain_init(cls)
+    if init is None:
+        return _inspect_defaults(cls)
+
+    code = init.__code__
+    # Skip self
+    positional = code.co_varnames[1 : code.co_argcount]
+    defaults = init.__defaults__ or ()
+    result = dict(zip(positional[len(positional) - len(defaults) :], defaults))
+    result.update(init.__kwdefaults__ or {})
+    return result
+
+
+def _inspect_defaults(cls):
+    import inspect
+
+    return {
+        p.name: p.default
+        for p in inspect.signature(cls).parameters.values()
+        if p.default is not inspect.Parameter.empty
+    }
 
-    return __rich_repr__
 
+def _inspect_params(cls):
+    import inspect
 
-def _getparams(cls):
     signature = inspect.signature(cls)
     params = list(signature.parameters)
     kwonly = {
@@ -174,15 +276,620 @@ def _getparams(cls):
     return params, kwonly
 
 
+def _create_fn(cls, name, args, body, doc=None, namespace=None):
+    """Compile a function called `name` for `cls` from lines of source code.
+
+    The function is given a ``__qualname__`` as if it had been written in the
+    class body. `namespace` provides the function's globals.
+    """
+    lines = [f"def {name}({', '.join(args)}):"]
+    lines.extend(f"    {line}" for line in body)
+    source = "\n".join(lines)
+
+    local_ns = {}
+    code = compile(source, f"<represent {cls.__qualname__}.{name}>", "exec")
+    exec(code, namespace if namespace is not None else {}, local_ns)
+
+    fn = local_ns[name]
+    fn.__qualname__ = f"{cls.__qualname__}.{name}"
+    fn.__module__ = cls.__module__
+    fn.__doc__ = doc
+    fn._represent_generated = True
+    return fn
+
+
+def _generated(fn):
+    """Mark `fn` as a method created by represent, which may be replaced."""
+    fn._represent_generated = True
+    return fn
+
+
+def _make_repr(cls):
+    """Create a :code:`__repr__` which joins the output of
+    :code:`__repr_into__`.
+    """
+    body = [
+        "buffer = []",
+        "self.__repr_into__(buffer)",
+        "return ''.join(buffer)",
+    ]
+    return _create_fn(cls, "__repr__", ["self"], body)
+
+
+def _make_compiled_repr(cls, info, lazy=None, safe=False):
+    """Create :code:`__repr__` and :code:`__repr_into__` specialized for the
+    attributes in `info`.
+
+    The attribute lookups are unrolled. If every value is of an atomic type
+    like :class:`int` or :class:`str`, or is a list, tuple, or dict of such
+    values, the repr can't be recursive, so it is formatted directly, e.g.
+
+    .. code-block:: python
+
+        def __repr__(self):
+            v0 = self.a
+            v1 = self.b
+            if type(v0) in atomic and (
+                type(v1) in atomic
+                or type(v1) in sequences and atomic.issuperset(map(type, v1))
+                or type(v1) in mappings and is_plain(v1, atomic)
+            ):
+                return f"{self.__class__.__name__}({v0!r}, b={v1!r})"
+            buffer = []
+            fields_into(self, buffer, v0, v1)
+            return ''.join(buffer)
+
+    Otherwise, ``fields_into`` appends atomic values using :func:`repr` and
+    the others using :func:`~represent.utilities.repr_into`, guarded against
+    recursion.
+
+    If `lazy` is given, instances of subclasses are passed to the method of
+    the same name in `lazy`, see :func:`_subclass_guard`.
+
+    If `safe` is true, values are loaded using
+    :func:`~represent.utilities.safe_getattr` and appended using
+    :func:`~represent.utilities.safe_repr_into`.
+
+    If `info` has defaults, see :func:`_make_omitting_repr`.
+    """
+    left, right = info.parantheses
+    fields = [(None, attr) for attr in info.args] + list(info.kw)
+    names = [f"v{i}" for i in range(len(fields))]
+
+    if info.defaults:
+        return _make_omitting_repr(cls, info, fields, names, lazy, safe)
+
+    into_body = ["append = buffer.append"]
+    literal = left
+    for i, ((keyword, _), name) in enumerate(zip(fields, names)):
+        prefix = (", " if i else "") + (keyword + "=" if keyword is not None else "")
+        literal += prefix
+        if i:
+            into_body.append(f"append({literal!r})")
+        else:
+            into_body.append(f"append(self.__class__.__name__ + {literal!r})")
+        into_body.extend(_value_into(name))
+        literal = ""
+    literal += right
+    if fields:
+        into_body.append(f"append({literal!r})")
+    else:
+        into_body.append(f"append(self.__class__.__name__ + {literal!r})")
+
+    fields_into = _create_fn(
+        cls,
+        "_fields_into",
+        ["self", "buffer", *names],
+        into_body,
+        namespace=_into_namespace(safe),
+    )
+    namespace = {
+        **_plain_namespace(),
+        "fields_into": recursive_repr_into()(fields_into),
+    }
+
+    formatted = _fstring(info, fields, names)
+    loads = _load_lines(fields, names, namespace, safe)
+    check = _plain_check(names)
+    args = "".join(f", {name}" for name in names)
+
+    repr_body = [
+        *_subclass_guard(cls, lazy, "__repr__", "self", namespace),
+        *loads,
+        f"if {check}:",
+        f"    return {formatted}",
+        "buffer = []",
+        f"fields_into(self, buffer{args})",
+        "return ''.join(buffer)",
+    ]
+    into_body = [
+        *_subclass_guard(cls, lazy, "__repr_into__", "self, buffer", namespace),
+        *loads,
+        f"if {check}:",
+        f"    buffer.append({formatted})",
+        "else:",
+        f"    fields_into(self, buffer{args})",
+    ]
+    return (
+        _create_fn(cls, "__repr__", ["self"], repr_body, namespace=namespace),
+        _create_fn(
+            cls, "__repr_into__", ["self", "buffer"], into_body, namespace=namespace
+        ),
+    )
+
+
+def _fstring(info, fields, names, cls_name="self.__class__.__name__"):
+    """Return an f-string expression formatting the repr of ``self`` from
+    the values `names` of `fields`, with the class name given by the
+    expression `cls_name`.
+    """
+    left, right = info.parantheses
+    template = _escape_braces(left)
+    for i, ((keyword, _), name) in enumerate(zip(fields, names)):
+        prefix = (", " if i else "") + (keyword + "=" if keyword is not None else "")
+        template += _escape_braces(prefix) + "{" + name + "!r}"
+    template += _escape_braces(right)
+    return "f" + repr("{" + cls_name + "}" + template)
+
+
+def _make_repr_many(cls, info, repr_into, safe=False):
+    """Create a function which adds the repr of each instance of exactly
+    `cls` in an iterable to a list, for :func:`~represent.output.repr_many`.
+
+    The loop is a list comprehension in the generated code, so instances
+    whose values can be formatted directly (see :func:`_make_compiled_repr`)
+    don't need a function call each, e.g.
+
+    .. code-block:: python
+
+        def _repr_many(objs, reprs):
+            name = cls.__name__
+            reprs += [
+                f"{name}(a={v0!r})"
+                if type(v0 := self.a) in atomic
+                else slow(self)
+                for self in objs
+            ]
+
+    `repr_into` is the :code:`__repr_into__` method compiled for `cls`.
+    """
+    fields = [(None, attr) for attr in info.args] + list(info.kw)
+    names = [f"v{i}" for i in range(len(fields))]
+    namespace = {
+        **_plain_namespace(),
+        "cls": cls,
+        "slow": partial(_repr_with, repr_into),
+    }
+    loads = _load_exprs(fields, namespace, safe)
+    body = [
+        "name = cls.__name__",
+        "reprs += [",
+        f"    {_fstring(info, fields, names, 'name')}",
+        f"    if {_plain_check(names, loads)}",
+        "    else slow(self)",
+        "    for self in objs",
+        "]",
+    ]
+    return _create_fn(cls, "_repr_many", ["objs", "reprs"], body, namespace=namespace)
+
+
+def _repr_with(repr_into, obj):
+    """Return the repr of `obj` using its :code:`__repr_into__` method."""
+    parts = []
+    repr_into(obj, parts)
+    return "".join(parts)
+
+
+def _make_omitting_repr(cls, info, fields, names, lazy, safe):
+    """Create :code:`__repr__` and :code:`__repr_into__` which omit keyword
+    arguments whose value is the default, e.g.
+
+    .. code-block:: python
+
+        def _fields_into(self, buffer, v0, v1):
+            append = buffer.append
+            append(self.__class__.__name__ + '(')
+            sep = ''
+            if not (v0 is d0 or type(v0) is type(d0) and v0 == d0):
+                append(sep + 'a=')
+                repr_into(v0, buffer)
+                sep = ', '
+            ...
+
+    As in :func:`_make_compiled_repr`, if every value is of an atomic type,
+    a version which calls :func:`repr` directly is used instead.
+    """
+    left, right = info.parantheses
+    namespace = _plain_namespace()
+
+    def body(value_into):
+        lines = [
+            "append = buffer.append",
+            f"append(self.__class__.__name__ + {left!r})",
+            "sep = ''",
+        ]
+        for i, ((keyword, attr), name) in enumerate(zip(fields, names)):
+            prefix = keyword + "=" if keyword is not None else ""
+            indent = ""
+            if keyword is not None and attr in info.defaults:
+                namespace[f"d{i}"] = info.defaults[attr]
+                lines.append(_default_check(name, f"d{i}"))
+                indent = "    "
+            lines.append(f"{indent}append(sep + {prefix!r})")
+            lines.extend(indent + line for line in value_into(name))
+            lines.append(f"{indent}sep = ', '")
+        lines.append(f"append({right!r})")
+        return lines
+
+    args = ["self", "buffer", *names]
+    atomic_into = _create_fn(
+        cls,
+        "_atomic_into",
+        args,
+        body(lambda name: [f"append(repr({name}))"]),
+        namespace=namespace,
+    )
+    fields_into = _create_fn(
+        cls,
+        "_fields_into",
+        args,
+        body(_value_into),
+        namespace={**namespace, **_into_namespace(safe)},
+    )
+    namespace["atomic_into"] = atomic_into
+    namespace["fields_into"] = recursive_repr_into()(fields_into)
+
+    loads = _load_lines(fields, names, namespace, safe)
+    check = _plain_check(names)
+    args = "".join(f", {name}" for name in names)
+
+    repr_body = [
+        *_subclass_guard(cls, lazy, "__repr__", "self", namespace),
+        *loads,
+        "buffer = []",
+        f"if {check}:",
+        f"    atomic_into(self, buffer{args})",
+        "else:",
+        f"    fields_into(self, buffer{args})",
+        "return ''.join(buffer)",
+    ]
+    into_body = [
+        *_subclass_guard(cls, lazy, "__repr_into__", "self, buffer", namespace),
+        *loads,
+        f"if {check}:",
+        f"    atomic_into(self, buffer{args})",
+        "else:",
+        f"    fields_into(self, buffer{args})",
+    ]
+    return (
+        _create_fn(cls, "__repr__", ["self"], repr_body, namespace=namespace),
+        _create_fn(
+            cls, "__repr_into__", ["self", "buffer"], into_body, namespace=namespace
+        ),
+    )
+
+
+def _default_check(name, default):
+    """Return an if statement for code which runs unless the value `name` is
+    the default `default`, inlining :func:`~represent.utilities.is_default`
+    so that the identity check doesn't need a function call.
+    """
+    return (
+        f"if not ({name} is {default} or "
+        f"type({name}) is type({default}) and {name} == {default}):"
+    )
+
+
+def _atomic_types():
+    """Return the types whose values can be shown using :func:`repr`
+    directly.
+    """
+    if formatters.registry:
+        # Values with a formatter can't use repr.
+        return frozenset(
+            t for t in ATOMIC_TYPES if formatters.find_formatter(t) is None
+        )
+    return ATOMIC_TYPES
+
+
+def _plain_namespace():
+    """Return the globals used by :func:`_plain_check`, including the
+    container types whose values can be shown using :func:`repr` if their
+    items are atomic.
+    """
+    sequences = frozenset({list, tuple})
+    mappings = frozenset({dict})
+    if formatters.registry:
+        sequences = frozenset(
+            t for t in sequences if formatters.find_formatter(t) is None
+        )
+        mappings = frozenset(
+            t for t in mappings if formatters.find_formatter(t) is None
+        )
+    return {
+        "atomic": _atomic_types(),
+        "sequences": sequences,
+        "mappings": mappings,
+        "is_plain": is_plain,
+    }
+
+
+def _plain_check(names, loads=None):
+    """Return an expression which is true if the values `names` can all be
+    shown using :func:`repr` directly, without risk of recursion.
+
+    If given, `loads` are expressions assigned to each name by the check
+    itself, so values after the first one that isn't plain aren't loaded.
+    """
+    if loads is None:
+        loads = names
+    else:
+        loads = [f"({name} := {load})" for name, load in zip(names, loads)]
+    checks = [
+        f"(type({load}) in atomic"
+        f" or type({name}) in sequences and atomic.issuperset(map(type, {name}))"
+        f" or type({name}) in mappings and is_plain({name}, atomic))"
+        for name, load in zip(names, loads)
+    ]
+    return " and ".join(checks) or "True"
+
+
+def _value_into(name):
+    """Return lines of code appending the repr of the value `name` to the
+    buffer, using :func:`repr` for atomic values to save a function call.
+    """
+    return [
+        f"if type({name}) in atomic:",
+        f"    append(repr({name}))",
+        "else:",
+        f"    repr_into({name}, buffer)",
+    ]
+
+
+def _into_namespace(safe):
+    return {
+        "atomic": _atomic_types(),
+        "repr_into": safe_repr_into if safe else repr_into,
+    }
+
+
+def _load_lines(fields, names, namespace, safe):
+    """Return lines of code which load each attribute in `fields` into the
+    local variable of the same index in `names`.
+    """
+    loads = _load_exprs(fields, namespace, safe)
+    return [f"{name} = {load}" for name, load in zip(names, loads)]
+
+
+def _load_exprs(fields, namespace, safe):
+    """Return an expression loading each attribute in `fields`."""
+    if safe:
+        namespace["safe_getattr"] = safe_getattr
+        load = "safe_getattr(self, {!r})".format
+    else:
+        load = "self.{}".format
+    return [load(attr) for _, attr in fields]
+
+
+def _escape_braces(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _subclass_guard(cls, lazy, name, args, namespace):
+    """Return lines of code which pass calls on instances of subclasses of
+    `cls` to the method `name` in `lazy`, so that subclasses don't use a plan
+    created for their parent.
+    """
+    if lazy is None:
+        return []
+    namespace["cls"] = cls
+    namespace[f"lazy{name}"] = lazy[name]
+    return [
+        "if self.__class__ is not cls:",
+        f"    return lazy{name}({args})",
+    ]
+
+
+def _make_bounded_repr(cls, max_length, max_depth):
+    """Create a :code:`__repr__` that uses :func:`bounded_repr`."""
+
+    def __repr__(self):
+        return bounded_repr(self, max_length=max_length, max_depth=max_depth)
+
+    __repr__.__qualname__ = f"{cls.__qualname__}.__repr__"
+    __repr__.__module__ = cls.__module__
+    return _generated(recursive_repr()(__repr__))
+
+
+def _make_bounded_repr_into(cls, max_length, max_depth):
+    """Create a :code:`__repr_into__` that uses :func:`bounded_repr`."""
+
+    def __repr_into__(self, buffer):
+        buffer.append(bounded_repr(self, max_length=max_length, max_depth=max_depth))
+
+    __repr_into__.__qualname__ = f"{cls.__qualname__}.__repr_into__"
+    __repr_into__.__module__ = cls.__module__
+    return _generated(__repr_into__)
+
+
+def _make_repr_methods(cls, repr_, repr_into, bounds=(None, None), cache=False):
+    """Return :code:`__repr__` and :code:`__repr_into__` for `cls`, given its
+    unbounded and uncached methods.
+    """
+    if bounds != (None, None):
+        repr_into = _make_bounded_repr_into(cls, *bounds)
+    if cache:
+        return _make_repr(cls), cached_repr_into(cls, repr_into)
+    if bounds != (None, None):
+        return _make_bounded_repr(cls, *bounds), repr_into
+    return repr_, repr_into
+
+
+def _make_repr_pretty(cls, info, lazy=None, safe=False):
+    """Create a :code:`_repr_pretty_` specialized for the attributes in `info`.
+
+    The pretty printer calls are unrolled, with the group indentation for
+    each keyword computed up front. Keyword arguments whose value is the
+    default are omitted if `info` has defaults.
+    """
+    left, right = info.parantheses
+    namespace = {}
+    body = [
+        *_subclass_guard(cls, lazy, "_repr_pretty_", "self, p, cycle", namespace),
+        "clsname = self.__class__.__name__",
+        "if cycle:",
+        f"    p.text(clsname + {left + '...' + right!r})",
+        "    return",
+        f"with p.group(len(clsname) + 1, clsname + {left!r}, {right!r}):",
+    ]
+
+    if safe:
+        namespace["safe_getattr"] = safe_getattr
+        load = "safe_getattr(self, {!r})".format
+    else:
+        load = "self.{}".format
+
+    # Formatters are only checked for if any are registered.
+    if safe:
+        namespace["safe_pretty_value"] = safe_pretty_value
+        pretty = "safe_pretty_value(p, {})".format
+    elif formatters.registry:
+        namespace["pretty_value"] = pretty_value
+        pretty = "pretty_value(p, {})".format
+    else:
+        pretty = "p.pretty({})".format
+
+    defaults = info.defaults or {}
+    if defaults:
+        # Whether a separator is needed depends on which arguments were
+        # omitted.
+        body.append("    first = True")
+        separator = [
+            "if not first:",
+            "    p.text(',')",
+            "    p.breakable()",
+        ]
+        shown = ["first = False"]
+    else:
+        separator = ["p.text(',')", "p.breakable()"]
+        shown = []
+
+    fields = [(None, attr) for attr in info.args] + list(info.kw)
+    for i, (keyword, attr) in enumerate(fields):
+        indent = "    "
+        value = load(attr)
+        if keyword is not None and attr in defaults:
+            namespace[f"d{i}"] = defaults[attr]
+            body.append(f"{indent}v{i} = {value}")
+            body.append(indent + _default_check(f"v{i}", f"d{i}"))
+            indent += "    "
+            value = f"v{i}"
+        if i or defaults:
+            body.extend(indent + line for line in separator)
+        if keyword is None:
+            body.append(f"{indent}{pretty(value)}")
+        else:
+            body.append(f"{indent}with p.group({len(keyword) + 1}, {keyword + '='!r}):")
+            body.append(f"{indent}    {pretty(value)}")
+        body.extend(indent + line for line in shown)
+
+    if not fields:
+        body.append("    pass")
+
+    doc = "Pretty printer for :class:`IPython.lib.pretty`"
+    return _create_fn(
+        cls, "_repr_pretty_", ["self", "p", "cycle"], body, doc, namespace
+    )
+
+
+def _make_rich_repr(cls, info, lazy=None, safe=False):
+    """Create a :code:`__rich_repr__` specialized for the attributes in `info`.
+
+    All arguments are returned as a single tuple rather than yielded one at a
+    time from a generator. If `info` has defaults, arguments are collected in
+    a list instead, omitting keyword arguments whose value is the default.
+    """
+    namespace = {}
+    if safe:
+        namespace["safe_getattr"] = safe_getattr
+        load = "safe_getattr(self, {!r})".format
+    else:
+        load = "self.{}".format
+    if formatters.registry:
+        namespace["rich_value"] = rich_value
+        value = "rich_value({})".format
+    else:
+        value = "{}".format
+
+    body = [*_subclass_guard(cls, lazy, "__rich_repr__", "self", namespace)]
+    if info.defaults:
+        body.append("items = []")
+        fields = [(None, attr) for attr in info.args] + list(info.kw)
+        for i, (keyword, attr) in enumerate(fields):
+            if keyword is not None and attr in info.defaults:
+                namespace[f"d{i}"] = info.defaults[attr]
+                body.append(f"v{i} = {load(attr)}")
+                body.append(_default_check(f"v{i}", f"d{i}"))
+                body.append(f"    items.append(({keyword!r}, {value(f'v{i}')}))")
+            else:
+                body.append(f"items.append(({keyword!r}, {value(load(attr))}))")
+        body.append("return items")
+    else:
+        items = [f"(None, {value(load(attr))})" for attr in info.args]
+        items.extend(f"({keyword!r}, {value(load(attr))})" for keyword, attr in info.kw)
+        body.append(f"return ({''.join(item + ', ' for item in items)})")
+    doc = "Pretty printer for :mod:`rich.pretty`"
+    return _create_fn(cls, "__rich_repr__", ["self"], body, doc, namespace)
+
+
+_AutoreprOptions = namedtuple(
+    "_AutoreprOptions",
+    "positional, include_pretty, include_rich, bounds, cache, safe, omit_defaults",
+)
+
+
 def _autorepr_decorate(
     cls,
-    repr,
-    repr_pretty,
-    rich_repr,
     positional=None,
     include_pretty=_DEFAULT_INCLUDE_PRETTY,
     include_rich=_DEFAULT_INCLUDE_RICH,
+    max_length=None,
+    max_depth=None,
+    cache=False,
+    safe=False,
+    omit_defaults=False,
 ):
+    # Create the plan now so that invalid arguments are reported when the
+    # class is decorated, but only compile methods when they are first used.
+    cls._represent = _autorepr_info(cls, positional, omit_defaults)
+    cls._represent_options = _AutoreprOptions(
+        positional,
+        include_pretty,
+        include_rich,
+        (max_length, max_depth),
+        cache,
+        safe,
+        omit_defaults,
+    )
+    # Read by bounded_repr.
+    cls._represent_safe = safe
+
+    for name, method in _LAZY_AUTOREPR_METHODS.items():
+        if name == "_repr_pretty_" and not include_pretty:
+            continue
+        if name == "__rich_repr__" and not include_rich:
+            continue
+        instrumentation.install(cls, name, method)
+
+    return cls
+
+
+def _autorepr_info(cls, positional, omit_defaults=False):
+    """Return the :class:`ReprInfo` for the arguments to :code:`cls.__init__`.
+
+    If `omit_defaults` is true, the defaults of keyword arguments are
+    recorded, so that they can be omitted.
+    """
     params, kwonly = _getparams(cls)
 
     # Args can be opted in as positional
@@ -200,14 +907,8 @@ def _autorepr_decorate(
     repr_args = []
     repr_kw = []
 
-    # Construct format string for __repr__
-    repr_fstr_parts = ["{self.__class__.__name__}", "("]
-    for i, arg in enumerate(params):
-        if i:
-            repr_fstr_parts.append(", ")
-
+    for arg in params:
         if arg in positional:
-            repr_fstr_parts.append(f"{{self.{arg}!r}}")
             repr_args.append(arg)
 
             if arg in kwonly:
@@ -219,21 +920,363 @@ def _autorepr_decorate(
                 )
         else:
             keyword_started = arg
-            repr_fstr_parts.append(f"{arg}={{self.{arg}!r}}")
-            repr_kw.append(arg)
+            repr_kw.append((arg, arg))
 
-    repr_fstr_parts.append(")")
+    defaults = None
+    if omit_defaults:
+        param_defaults = _getdefaults(cls)
+        defaults = {
+            attr: param_defaults[attr] for _, attr in repr_kw if attr in param_defaults
+        }
 
-    # Store as class variable.
-    cls._represent = ReprInfo("".join(repr_fstr_parts), repr_args, repr_kw)
+    return ReprInfo(repr_args, repr_kw, defaults=defaults or None)
 
-    cls.__repr__ = repr
-    if include_pretty:
-        cls._repr_pretty_ = repr_pretty
-    if include_rich:
-        cls.__rich_repr__ = rich_repr
 
-    return cls
+def _autorepr_plan(cls):
+    """Return the :class:`ReprInfo` for `cls`, which was decorated with
+    :func:`autorepr` or inherits from such a class.
+
+    Subclasses get their own plan from their :code:`__init__`, created the
+    first time it is needed. If their parameters can't be shown as
+    attributes, e.g. because :code:`__init__` passes :code:`*args` and
+    :code:`**kwargs` to the parent class, the plan of the parent is used.
+    """
+    info = vars(cls).get("_represent")
+    if info is not None:
+        return info
+
+    with _compile_lock:
+        info = vars(cls).get("_represent")
+        if info is not None:
+            return info
+        parent = _autorepr_plan(
+            next(
+                base for base in cls.__mro__[1:] if hasattr(base, "_represent_options")
+            )
+        )
+        if _passes_through(cls, parent):
+            info = parent
+        else:
+            try:
+                options = cls._represent_options
+                info = _autorepr_info(cls, options.positional, options.omit_defaults)
+            except ValueError:
+                # The options given to autorepr don't fit the subclass, so
+                # use the plan of its parent.
+                info = parent
+        cls._represent = info
+        return info
+
+
+def _passes_through(cls, parent):
+    """Return True if the subclass `cls` has parameters which aren't likely
+    to be attributes of its instances: variable parameters, or parameters
+    which aren't in the `parent` plan, used in :code:`__init__`, or
+    attributes of `cls`.
+    """
+    init = _plain_init(cls)
+    if init is not None:
+        code = init.__code__
+        if code.co_flags & (_CO_VARARGS | _CO_VARKEYWORDS):
+            return True
+        params, _ = _code_params(code)
+    else:
+        import inspect
+
+        parameters = inspect.signature(cls).parameters.values()
+        if any(p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in parameters):
+            return True
+        params = [p.name for p in parameters]
+        code = getattr(inspect.unwrap(cls.__init__), "__code__", None)
+
+    known = {*parent.args, *(attr for _, attr in parent.kw)}
+    if code is not None:
+        known.update(code.co_names)
+    return not all(name in known or hasattr(cls, name) for name in params)
+
+
+def _autorepr_methods(cls):
+    """Return the methods compiled from the plan for `cls`, compiling and
+    installing them on `cls` the first time.
+    """
+    methods = vars(cls).get("_represent_methods")
+    if methods is not None:
+        return methods
+
+    with _compile_lock:
+        methods = vars(cls).get("_represent_methods")
+        if methods is not None:
+            # Compiled by another thread while we waited.
+            return methods
+        return _compile_autorepr_methods(cls)
+
+
+def _compile_autorepr_methods(cls):
+    info = _autorepr_plan(cls)
+    options = cls._represent_options
+    lazy = _LAZY_AUTOREPR_METHODS
+
+    methods = dict(
+        zip(
+            ("__repr__", "__repr_into__"),
+            _make_compiled_repr(cls, info, lazy, options.safe),
+        )
+    )
+    methods["__repr__"], methods["__repr_into__"] = _make_repr_methods(
+        cls,
+        methods["__repr__"],
+        methods["__repr_into__"],
+        options.bounds,
+        options.cache,
+    )
+    if options.include_pretty:
+        methods["_repr_pretty_"] = _make_repr_pretty(cls, info, lazy, options.safe)
+    if options.include_rich:
+        methods["__rich_repr__"] = _make_rich_repr(cls, info, lazy, options.safe)
+
+    for name, method in methods.items():
+        # Replace the lazy methods, but not those defined by the user.
+        if getattr(getattr(cls, name, None), "_represent_generated", False):
+            instrumentation.install(cls, name, method)
+    # Set last, so other threads only see the methods once installed.
+    cls._represent_methods = methods
+    return methods
+
+
+def _make_lazy_autorepr_methods():
+    """Create the methods installed by :func:`autorepr`, which compile the
+    methods for the class of the instance when they are first called.
+    """
+
+    @_generated
+    def __repr__(self):
+        return _autorepr_methods(type(self))["__repr__"](self)
+
+    @_generated
+    def __repr_into__(self, buffer):
+        return _autorepr_methods(type(self))["__repr_into__"](self, buffer)
+
+    @_generated
+    def _repr_pretty_(self, p, cycle):
+        return _autorepr_methods(type(self))["_repr_pretty_"](self, p, cycle)
+
+    @_generated
+    def __rich_repr__(self):
+        return _autorepr_methods(type(self))["__rich_repr__"](self)
+
+    return {
+        "__repr__": __repr__,
+        "__repr_into__": __repr_into__,
+        "_repr_pretty_": _repr_pretty_,
+        "__rich_repr__": __rich_repr__,
+    }
+
+
+_LAZY_AUTOREPR_METHODS = _make_lazy_autorepr_methods()
+
+
+def _repr_many_function(cls):
+    """Return a function which appends the repr of each instance of exactly
+    `cls` in an iterable to a list, for :func:`~represent.output.repr_many`.
+
+    Classes with a plan get a function compiled from it, other classes
+    created by represent use their (compiled) :code:`__repr_into__` for each
+    instance, and other classes use :func:`repr`.
+    """
+    into = repr_into_method(cls)
+    if into is None:
+        if cls in ATOMIC_TYPES and not formatters.registry:
+            return _repr_each
+        # Containers may hold objects which use represent or formatters.
+        return partial(_repr_into_each, repr_into)
+
+    info = None
+    if into is _LAZY_AUTOREPR_METHODS["__repr_into__"]:
+        into = _autorepr_methods(cls)["__repr_into__"]
+        options = cls._represent_options
+        if options.bounds == (None, None) and not options.cache:
+            info, safe = _autorepr_plan(cls), options.safe
+    elif (
+        issubclass(cls, ReprHelperMixin)
+        and cls._represent_bounds is None
+        and not cls._represent_cache
+    ):
+        info, safe = vars(cls).get("_represent"), cls._represent_safe
+
+    if info is None or info.defaults:
+        return partial(_repr_into_each, into)
+    return _make_repr_many(cls, info, into, safe)
+
+
+def _repr_each(objs, reprs):
+    reprs.extend(map(repr, objs))
+
+
+def _repr_into_each(repr_into, objs, reprs):
+    append = reprs.append
+    for obj in objs:
+        parts = []
+        repr_into(obj, parts)
+        append("".join(parts))
+
+
+def _uses_represent(cls):
+    """Return True if `cls` uses :func:`autorepr` or :class:`ReprHelperMixin`."""
+    return getattr(cls, "_represent_options", None) is not None or issubclass(
+        cls, ReprHelperMixin
+    )
+
+
+def _represent_info(cls):
+    """Return the :class:`ReprInfo` for `cls`, or None if it uses
+    :class:`ReprHelperMixin` without a recorded plan.
+    """
+    if getattr(cls, "_represent_options", None) is not None:
+        return _autorepr_plan(cls)
+    return getattr(cls, "_represent", None)
+
+
+class _TraceAbort(Exception):
+    """Raised when a :code:`_repr_helper_` cannot be recorded as a plan."""
+
+
+class _TracingProbe:
+    """Stands in for ``self`` while recording :code:`_repr_helper_`.
+
+    Reading anything from the instance means the helper calls may depend on
+    its state, so the plan can't be recorded.
+    """
+
+    __slots__ = ()
+
+    def __getattribute__(self, name):
+        raise _TraceAbort
+
+
+class _TracingReprHelper(BaseReprHelper):
+    """Record the attribute-based calls made by :code:`_repr_helper_`."""
+
+    __slots__ = ("args", "kw")
+
+    def __init__(self, cls):
+        self.parantheses = Parantheses(left="(", right=")")
+        self.other = _TracingProbe()
+        self.other_cls = cls
+        self.iarg = 0
+        self.keyword_started = False
+        self.args = []
+        self.kw = []
+
+    def positional_from_attr(self, attr_name):
+        if self.keyword_started:
+            # Let the dynamic path raise the error on each call.
+            raise _TraceAbort
+        self.args.append(_check_attr_name(attr_name))
+
+    def positional_with_value(self, value, raw=False):
+        raise _TraceAbort
+
+    def keyword_from_attr(self, name, attr_name=None):
+        self.keyword_started = True
+        attr_name = attr_name or name
+        self.kw.append((name, _check_attr_name(attr_name)))
+
+    def keyword_with_value(self, name, value, raw=False):
+        raise _TraceAbort
+
+
+def _check_attr_name(attr_name):
+    # Generated code uses attribute access rather than getattr.
+    if not attr_name.isidentifier() or iskeyword(attr_name):
+        raise _TraceAbort
+    return attr_name
+
+
+def _has_branches(func):
+    """Return True if `func` contains conditional jumps, in which case a single
+    trace can't be assumed to represent every call.
+    """
+    import dis
+
+    return any(
+        "JUMP" in instr.opname and "IF" in instr.opname
+        for instr in dis.get_instructions(func)
+    )
+
+
+def _trace_repr_helper(cls):
+    """Record the calls :code:`cls._repr_helper_` makes as a :class:`ReprInfo`.
+
+    Returns None if the calls can't be recorded, e.g. because values are
+    passed using :code:`*_with_value` or the method branches.
+    """
+    func = getattr(cls, "_repr_helper_", None)
+    if not isinstance(func, FunctionType) or _has_branches(func):
+        return None
+
+    r = _TracingReprHelper(cls)
+    try:
+        func(r.other, r)
+    except Exception:
+        return None
+
+    return ReprInfo(r.args, r.kw, r.parantheses)
+
+
+_HELPER_MIXIN_METHODS = (
+    "__repr__",
+    "__repr_into__",
+    "_repr_pretty_",
+    "__rich_repr__",
+)
+
+
+def _compile_helper_plan(cls):
+    """Install methods compiled from the recorded :code:`_repr_helper_` calls
+    on `cls`, or restore the dynamic methods if they can't be recorded.
+    """
+    info = None
+    if cls._represent_trace:
+        info = _trace_repr_helper(cls)
+
+    # Subclasses shouldn't use a plan recorded for their parent.
+    cls._represent = info
+
+    if info is None and cls._represent_safe:
+        methods = dict(_SAFE_HELPER_METHODS)
+    elif info is None:
+        methods = {
+            name: ReprHelperMixin.__dict__[name] for name in _HELPER_MIXIN_METHODS
+        }
+    else:
+        safe = cls._represent_safe
+        methods = dict(
+            zip(
+                ("__repr__", "__repr_into__"),
+                _make_compiled_repr(cls, info, safe=safe),
+            )
+        )
+        methods.update(
+            {
+                "_repr_pretty_": _make_repr_pretty(cls, info, safe=safe),
+                "__rich_repr__": _make_rich_repr(cls, info, safe=safe),
+            }
+        )
+
+    bounds = cls._represent_bounds or (None, None)
+    if bounds != (None, None) or cls._represent_cache:
+        methods["__repr__"], methods["__repr_into__"] = _make_repr_methods(
+            cls,
+            methods["__repr__"],
+            methods["__repr_into__"],
+            bounds,
+            cls._represent_cache,
+        )
+
+    for name, method in methods.items():
+        # Leave methods alone if the user has defined them.
+        if getattr(getattr(cls, name), "_represent_generated", False):
+            instrumentation.install(cls, name, method)
 
 
 class ReprHelperMixin:
@@ -252,22 +1295,162 @@ class ReprHelperMixin:
             r.keyword_from_attr('keyword', 'attrname')
             r.keyword_with_value('keyword', value)
 
+    Passing ``trace=True`` as a class keyword records the calls made by
+    :code:`_repr_helper_` once per class and compiles them into methods that
+    are as fast as those created by :func:`autorepr`:
+
+    .. code-block:: python
+
+        class A(ReprHelperMixin, trace=True):
+            def _repr_helper_(self, r):
+                r.positional_from_attr('a')
+                r.keyword_from_attr('b')
+
+    This only works if :code:`_repr_helper_` makes the same calls for every
+    instance. If it reads from ``self`` (e.g. to use
+    :code:`positional_with_value`) or contains conditional statements, the
+    class falls back to calling :code:`_repr_helper_` each time.
+
+    The `max_length` and `max_depth` class keywords limit the output of
+    :code:`__repr__`, see :func:`~represent.bounded.bounded_repr`. The `cache`
+    class keyword computes :code:`__repr__` once per instance, and the `safe`
+    class keyword reads attributes without side effects, see
+    :func:`autorepr`.
+
     .. versionadded:: 1.3
+
+    .. versionchanged:: 2.3.0
+        `trace`, `max_length`, `max_depth`, `cache`, and `safe` class
+        keywords added.
     """
 
     __slots__ = ()
 
+    _represent_trace = False
+    _represent_bounds = None
+    _represent_cache = False
+    _represent_safe = False
+
+    def __init_subclass__(
+        cls,
+        *,
+        trace=None,
+        max_length=None,
+        max_depth=None,
+        cache=None,
+        safe=None,
+        **kwargs,
+    ):
+        super().__init_subclass__(**kwargs)
+        if trace is not None:
+            cls._represent_trace = trace
+        if max_length is not None or max_depth is not None:
+            cls._represent_bounds = (max_length, max_depth)
+        if cache is not None:
+            cls._represent_cache = cache
+        if safe is not None:
+            cls._represent_safe = safe
+        if (
+            cls._represent_trace
+            or cls._represent_bounds is not None
+            or cls._represent_cache
+            or cls._represent_safe
+            or safe is not None
+            or getattr(cls, "_represent", None) is not None
+        ):
+            _compile_helper_plan(cls)
+
+    # Classes with the safe class keyword use _SAFE_HELPER_METHODS instead.
+
+    @_generated
     @recursive_repr()
     def __repr__(self):
         r = ReprHelper(self)
         self._repr_helper_(r)
         return str(r)
 
+    @_generated
+    @recursive_repr_into()
+    def __repr_into__(self, buffer):
+        r = ReprHelper(self)
+        self._repr_helper_(r)
+        r._write_into(buffer)
+
+    @_generated
     def _repr_pretty_(self, p, cycle):
         with PrettyReprHelper(self, p, cycle) as r:
             self._repr_helper_(r)
 
+    @_generated
     def __rich_repr__(self):
         r = RichReprHelper(self)
         self._repr_helper_(r)
         yield from r
+
+
+instrumentation.register(ReprHelperMixin)
+
+
+def _make_safe_helper_methods():
+    """Return the methods of :class:`ReprHelperMixin` for classes with the
+    `safe` class keyword whose calls can't be compiled.
+    """
+
+    @_generated
+    @recursive_repr()
+    def __repr__(self):
+        r = ReprHelper(self, safe=True)
+        self._repr_helper_(r)
+        return str(r)
+
+    @_generated
+    @recursive_repr_into()
+    def __repr_into__(self, buffer):
+        r = ReprHelper(self, safe=True)
+        self._repr_helper_(r)
+        r._write_into(buffer)
+
+    @_generated
+    def _repr_pretty_(self, p, cycle):
+        with PrettyReprHelper(self, p, cycle, safe=True) as r:
+            self._repr_helper_(r)
+
+    @_generated
+    def __rich_repr__(self):
+        r = RichReprHelper(self, safe=True)
+        self._repr_helper_(r)
+        yield from r
+
+    methods = {
+        "__repr__": __repr__,
+        "__repr_into__": __repr_into__,
+        "_repr_pretty_": _repr_pretty_,
+        "__rich_repr__": __rich_repr__,
+    }
+    for name, method in methods.items():
+        method.__qualname__ = f"ReprHelperMixin.{name}"
+    return methods
+
+
+_SAFE_HELPER_METHODS = _make_safe_helper_methods()
+
+
+def _recompile_methods():
+    """Recompile the methods created by represent, which depend on the
+    registered formatters.
+    """
+    with _compile_lock:
+        for cls in instrumentation.installed_classes():
+            if "_represent_methods" in vars(cls):
+                # Compile again when next used.
+                del cls._represent_methods
+                for name, method in _LAZY_AUTOREPR_METHODS.items():
+                    if getattr(vars(cls).get(name), "_represent_generated", False):
+                        instrumentation.install(cls, name, method)
+            elif vars(cls).get("_represent") is not None and issubclass(
+                cls, ReprHelperMixin
+            ):
+                _compile_helper_plan(cls)
+
+
+formatters.listeners.append(_recompile_methods)
@@ -0,0 +1,108 @@
+from abc import get_cache_token
+from functools import singledispatch
+
+__all__ = ["register_formatter", "unregister_formatter"]
+
+# Type -> function returning the string to show for its instances. This dict
+# is only mutated, never rebound, so other modules can check it cheaply.
+registry = {}
+
+# Type -> formatter found for it, or None. Replaced with an empty dict after
+# the registry changes, so a lookup racing with the change in another thread
+# can only add a stale entry to the discarded dict.
+_dispatch_cache = {}
+
+
+def _no_formatter(value):
+    pass
+
+
+# Resolves the formatter for a type which isn't in _dispatch_cache, including
+# formatters registered for abstract base classes. Recreated when the
+# registry changes.
+_dispatcher = singledispatch(_no_formatter)
+
+# The ABC cache token when _dispatch_cache was created, if formatters are
+# registered for abstract base classes, whose virtual subclasses can change.
+_cache_token = None
+
+# Functions called after the registry changes, e.g. to recompile the methods
+# created by autorepr.
+listeners = []
+
+
+def register_formatter(cls, func=None):
+    """Register `func` to create the string shown for values of type `cls`
+    (and its subclasses) in the output of :func:`~represent.core.autorepr`,
+    :class:`~represent.core.ReprHelperMixin`, and the helpers, instead of
+    their :func:`repr`.
+
+    This is useful for types whose repr is slow or verbose:
+
+    .. code-block:: python
+
+        register_formatter(datetime, lambda dt: f'<{dt.isoformat()}>')
+
+    It can also be used as a decorator:
+
+    .. code-block:: python
+
+        @register_formatter(UUID)
+        def format_uuid(value):
+            return f'UUID({str(value)!r})'
+
+    The formatter for a value is found as by :func:`functools.singledispatch`
+    and cached, so `cls` can also be an abstract base class such as
+    :class:`numbers.Number` or :class:`collections.abc.Mapping`. When no
+    formatters are registered, values aren't checked at all.
+
+    .. versionadded:: 2.3.0
+    """
+    if func is None:
+        return lambda func: register_formatter(cls, func)
+
+    registry[cls] = func
+    _changed()
+    return func
+
+
+def unregister_formatter(cls):
+    """Remove the formatter registered for `cls`.
+
+    .. versionadded:: 2.3.0
+    """
+    del registry[cls]
+    _changed()
+
+
+def find_formatter(cls):
+    """Return the formatter for values of type `cls`, or None."""
+    if _cache_token is not None and _cache_token != get_cache_token():
+        # A virtual subclass was registered with an ABC, which may change
+        # the formatters of types already looked up.
+        _changed()
+    cache = _dispatch_cache
+    try:
+        return cache[cls]
+    except KeyError:
+        pass
+
+    func = _dispatcher.dispatch(cls)
+    if func is _no_formatter:
+        func = None
+    cache[cls] = func
+    return func
+
+
+def _changed():
+    global _dispatch_cache, _dispatcher, _cache_token
+    dispatcher = singledispatch(_no_formatter)
+    for cls, func in registry.items():
+        dispatcher.register(cls, func)
+    _dispatcher = dispatcher
+    _cache_token = None
+    if any(hasattr(cls, "__abstractmethods__") for cls in registry):
+        _cache_token = get_cache_token()
+    _dispatch_cache = {}
+    for listener in listeners:
+        listener()
@@ -1,17 +1,39 @@
 from abc import ABCMeta, abstractmethod
 
-from .utilities import Parantheses, inherit_docstrings
+from .formatters import find_formatter, registry
+from .utilities import (
+    ATOMIC_TYPES,
+    Parantheses,
+    StreamBuffer,
+    inherit_docstrings,
+    repr_into,
+    safe_getattr,
+    safe_repr_into,
+)
 
-__all__ = ["ReprHelper", "PrettyReprHelper", "RichReprHelper"]
+__all__ = ["ReprHelper", "PrettyReprHelper", "RichReprHelper", "DictReprHelper"]
+
+
+_DEFAULT_PARANTHESES = Parantheses(left="(", right=")")
 
 
 class BaseReprHelper(metaclass=ABCMeta):
-    def __init__(self, other):
-        self.parantheses = Parantheses(left="(", right=")")
+    __slots__ = (
+        "_parantheses",
+        "other",
+        "other_cls",
+        "iarg",
+        "keyword_started",
+        "_safe",
+    )
+
+    def __init__(self, other, safe=False):
+        self._parantheses = _DEFAULT_PARANTHESES
         self.other = other
         self.other_cls = other.__class__
         self.iarg = 0
         self.keyword_started = False
+        self._safe = safe
 
     @property
     def parantheses(self):
@@ -19,7 +41,30 @@ class BaseReprHelper(metaclass=ABCMeta):
 
     @parantheses.setter
     def parantheses(self, value):
-        self._parantheses = Parantheses._make(value)
+        if not isinstance(value, Parantheses):
+            value = Parantheses._make(value)
+        self._parantheses = value
+
+    def reset(self, other):
+        """Reset the helper so it can be reused for `other`, avoiding the
+        creation of a new helper in tight loops:
+
+        .. code-block:: python
+
+            r = ReprHelper(objects[0])
+            for obj in objects:
+                r.reset(obj)
+                obj._repr_helper_(r)
+                print(r)
+
+        .. versionadded:: 2.3.0
+        """
+        BaseReprHelper.__init__(self, other, self._safe)
+
+    def _getattr(self, attr_name):
+        if self._safe:
+            return safe_getattr(self.other, attr_name)
+        return getattr(self.other, attr_name)
 
     @abstractmethod
     def positional_from_attr(self, attr_name):
@@ -74,6 +119,12 @@ class ReprHelper(BaseReprHelper):
             r.keyword_from_attr('name')
             return str(r)
 
+    If `safe` is true, attributes are only read from the instance
+    :code:`__dict__` or slots, so that properties and other descriptors
+    aren't called (attributes which can't be read are shown as
+    ``<not loaded>``), and values whose repr raises an exception are shown
+    using :code:`object.__repr__`.
+
     .. versionchanged:: 1.4
 
         `parantheses` property added. Must be set before `str(r)` is called:
@@ -85,50 +136,116 @@ class ReprHelper(BaseReprHelper):
                 r.parantheses = ('<', '>')
                 r.keyword_from_attr('name')
                 return str(r)
+
+    .. versionchanged:: 2.3.0
+        `safe` argument added.
     """
 
-    def __init__(self, other):
+    __slots__ = ("repr_parts",)
+
+    def __init__(self, other, safe=False):
         self.repr_parts = []
-        super().__init__(other)
+        BaseReprHelper.__init__(self, other, safe)
+
+    def reset(self, other):
+        super().reset(other)
+        self.repr_parts.clear()
 
     def positional_from_attr(self, attr_name):
         if self.keyword_started:
             raise ValueError("positional arguments cannot follow keyword arguments")
         self._ensure_comma()
-        self.repr_parts.append(repr(getattr(self.other, attr_name)))
+        value = self._getattr(attr_name)
+        if type(value) in ATOMIC_TYPES and not registry:
+            self.repr_parts.append(repr(value))
+        else:
+            self._repr_into("", value)
         self.iarg += 1
 
     def positional_with_value(self, value, raw=False):
         if self.keyword_started:
             raise ValueError("positional arguments cannot follow keyword arguments")
         self._ensure_comma()
-        value = value if raw else repr(value)
-        self.repr_parts.append(value)
+        if raw:
+            self.repr_parts.append(value)
+        else:
+            self._repr_into("", value)
         self.iarg += 1
 
     def keyword_from_attr(self, name, attr_name=None):
+        # _ensure_comma and _getattr are inlined, since this is the most
+        # common call.
         self.keyword_started = True
-        self._ensure_comma()
-        attr_name = attr_name or name
-        self.repr_parts.append(f"{name}={getattr(self.other, attr_name)!r}")
+        parts = self.repr_parts
+        if self.iarg:
+            parts.append(", ")
+        if self._safe:
+            value = safe_getattr(self.other, attr_name or name)
+        else:
+            value = getattr(self.other, attr_name or name)
+        if type(value) in ATOMIC_TYPES and not registry:
+            parts.append(f"{name}={value!r}")
+        else:
+            self._repr_into(f"{name}=", value)
         self.iarg += 1
 
     def keyword_with_value(self, name, value, raw=False):
         self.keyword_started = True
         self._ensure_comma()
-        value = value if raw else repr(value)
-        self.repr_parts.append(f"{name}={value}")
+        if raw:
+            self.repr_parts.append(f"{name}={value}")
+        else:
+            self._repr_into(f"{name}=", value)
         self.iarg += 1
 
+    def _repr_into(self, prefix, value):
+        """Append `prefix` followed by the repr of `value`."""
+        parts = self.repr_parts
+        if type(value) in ATOMIC_TYPES and not registry:
+            # Nothing to share a buffer with, so format it in one step.
+            parts.append(f"{prefix}{value!r}")
+            return
+        if prefix:
+            parts.append(prefix)
+        if self._safe:
+            safe_repr_into(value, parts)
+        else:
+            repr_into(value, parts)
+
     def _ensure_comma(self):
         if self.iarg:
             self.repr_parts.append(", ")
 
     def __str__(self):
-        beginning = [self.other_cls.__name__, self.parantheses.left]
-        end = [self.parantheses.right]
-        all_parts = beginning + self.repr_parts + end
-        return "".join(all_parts)
+        left, right = self._parantheses
+        return "".join((self.other_cls.__name__, left, *self.repr_parts, right))
+
+    def write_to(self, stream):
+        """Write the repr to the text stream `stream` in parts, without
+        joining them into a string first.
+
+        .. versionadded:: 2.3.0
+        """
+        self._write_into(StreamBuffer(stream))
+
+    def __bytes__(self):
+        """Return the repr encoded as UTF-8, see
+        :func:`~represent.output.repr_bytes`.
+
+        .. versionadded:: 2.3.0
+        """
+        return str(self).encode("utf-8", "backslashreplace")
+
+    def _write_into(self, buffer):
+        """Append the parts of the repr to `buffer`, as :code:`__repr_into__`
+        would.
+        """
+        left, right = self._parantheses
+        append = buffer.append
+        append(self.other_cls.__name__ + left)
+        for part in self.repr_parts:
+            append(part)
+        append(right)
 
 
 class PrettyReprHelper(BaseReprHelper):
@@ -154,12 +271,17 @@ class PrettyReprHelper(BaseReprHelper):
                 r.parantheses = ('<', '>')
                 with r:
                     r.keyword_from_attr('name')
+
+    .. versionchanged:: 2.3.0
+        `safe` argument added, see :class:`ReprHelper`.
     """
 
-    def __init__(self, other, p, cycle):
+    __slots__ = ("p", "cycle")
+
+    def __init__(self, other, p, cycle, safe=False):
         self.p = p
         self.cycle = cycle
-        super().__init__(other)
+        super().__init__(other, safe)
 
     def positional_from_attr(self, attr_name):
         if self.cycle:
@@ -168,7 +290,7 @@ class PrettyReprHelper(BaseReprHelper):
         if self.keyword_started:
             raise ValueError("positional arguments cannot follow keyword arguments")
         self._ensure_comma()
-        self.p.pretty(getattr(self.other, attr_name))
+        self._pretty(self._getattr(attr_name))
         self.iarg += 1
 
     def positional_with_value(self, value, raw=False):
@@ -181,7 +303,7 @@ class PrettyReprHelper(BaseReprHelper):
         if raw:
             self.p.text(str(value))
         else:
-            self.p.pretty(value)
+            self._pretty(value)
         self.iarg += 1
 
     def keyword_from_attr(self, name, attr_name=None):
@@ -192,7 +314,7 @@ class PrettyReprHelper(BaseReprHelper):
         self._ensure_comma()
         attr_name = attr_name or name
         with self.p.group(len(name) + 1, name + "="):
-            self.p.pretty(getattr(self.other, attr_name))
+            self._pretty(self._getattr(attr_name))
         self.iarg += 1
 
     def keyword_with_value(self, name, value, raw=False):
@@ -205,9 +327,15 @@ class PrettyReprHelper(BaseReprHelper):
             if raw:
                 self.p.text(str(value))
             else:
-                self.p.pretty(value)
+                self._pretty(value)
         self.iarg += 1
 
+    def _pretty(self, value):
+        if self._safe:
+            safe_pretty_value(self.p, value)
+        else:
+            pretty_value(self.p, value)
+
     def _ensure_comma(self):
         if self.iarg:
             self.p.text(",")
@@ -251,6 +379,8 @@ class RawReprWrapper:
     object which returns str() when repr() is called.
     """
 
+    __slots__ = ("_object",)
+
     def __init__(self, o: object):
         self._object = o
 
@@ -258,6 +388,39 @@ class RawReprWrapper:
         return str(self._object)
 
 
+def pretty_value(p, value):
+    """Pretty print `value` with `p`, using its registered formatter if there
+    is one.
+    """
+    if registry:
+        func = find_formatter(type(value))
+        if func is not None:
+            p.text(func(value))
+            return
+    p.pretty(value)
+
+
+def safe_pretty_value(p, value):
+    """Like :func:`pretty_value`, but if pretty printing `value` raises an
+    exception, show the default repr from :class:`object` instead.
+    """
+    try:
+        pretty_value(p, value)
+    except Exception:
+        p.text(object.__repr__(value))
+
+
+def rich_value(value):
+    """Return `value`, or a wrapper showing the output of its registered
+    formatter if there is one.
+    """
+    if registry:
+        func = find_formatter(type(value))
+        if func is not None:
+            return RawReprWrapper(func(value))
+    return value
+
+
 class RichReprHelper(BaseReprHelper):
     """Help manual construction of :code:`__rich_repr__` for
     :py:mod:`rich.pretty`.
@@ -270,30 +433,97 @@ class RichReprHelper(BaseReprHelper):
             r = RichReprHelper(self)
             r.keyword_from_attr('name')
             yield from r
+
+    .. versionchanged:: 2.3.0
+        `safe` argument added, see :class:`ReprHelper`. Exceptions raised by
+        the repr of values are handled by rich.
     """
 
-    def __init__(self, other):
+    __slots__ = ("_tuples",)
+
+    def __init__(self, other, safe=False):
+        self._tuples = []
+        super().__init__(other, safe)
+
+    def reset(self, other):
+        super().reset(other)
         self._tuples = []
-        super().__init__(other)
 
     def positional_from_attr(self, attr_name):
         if self.keyword_started:
             raise ValueError("positional arguments cannot follow keyword arguments")
-        self._tuples.append((None, getattr(self.other, attr_name)))
+        self._tuples.append((None, rich_value(self._getattr(attr_name))))
 
     def positional_with_value(self, value, raw=False):
         if self.keyword_started:
             raise ValueError("positional arguments cannot follow keyword arguments")
-        self._tuples.append((None, RawReprWrapper(value) if raw else value))
+        self._tuples.append((None, RawReprWrapper(value) if raw else rich_value(value)))
 
     def keyword_from_attr(self, name, attr_name=None):
         self.keyword_started = True
         attr_name = attr_name or name
-        self._tuples.append((name, getattr(self.other, attr_name)))
+        self._tuples.append((name, rich_value(self._getattr(attr_name))))
 
     def keyword_with_value(self, name, value, raw=False):
         self.keyword_started = True
-        return self._tuples.append((name, RawReprWrapper(value) if raw else value))
+        return self._tuples.append(
+            (name, RawReprWrapper(value) if raw else rich_value(value))
+        )
 
     def __iter__(self):
         return iter(self._tuples)
+
+
+@inherit_docstrings
+class DictReprHelper(BaseReprHelper):
+    """Collect the arguments of a repr as ``(name, value)`` pairs, like
+    :class:`RichReprHelper`, for structured output such as
+    :func:`~represent.structured.to_dict`.
+
+    Positional arguments are named after their attribute, or by their
+    position (an :class:`int`) if added using :meth:`positional_with_value`.
+    Values are collected as they are, rather than their repr:
+
+    .. code-block:: python
+
+        r = DictReprHelper(obj)
+        obj._repr_helper_(r)
+        fields = dict(r)
+
+    .. versionadded:: 2.3.0
+    """
+
+    __slots__ = ("_pairs",)
+
+    def __init__(self, other, safe=False):
+        self._pairs = []
+        super().__init__(other, safe)
+
+    def reset(self, other):
+        super().reset(other)
+        self._pairs = []
+
+    def positional_from_attr(self, attr_name):
+        if self.keyword_started:
+            raise ValueError("positional arguments cannot follow keyword arguments")
+        self._pairs.append((attr_name, self._getattr(attr_name)))
+        self.iarg += 1
+
+    def positional_with_value(self, value, raw=False):
+        if self.keyword_started:
+            raise ValueError("positional arguments cannot follow keyword arguments")
+        self._pairs.append((self.iarg, value))
+        self.iarg += 1
+
+    def keyword_from_attr(self, name, attr_name=None):
+        self.keyword_started = True
+        self._pairs.append((name, self._getattr(attr_name or name)))
+        self.iarg += 1
+
+    def keyword_with_value(self, name, value, raw=False):
+        self.keyword_started = True
+        self._pairs.append((name, value))
+        self.iarg += 1
+
+    def __iter__(self):
+        return iter(self._pairs)
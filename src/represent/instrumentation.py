@@ -0,0 +1,203 @@
+import os
+from _thread import allocate_lock
+from collections import namedtuple
+from functools import update_wrapper
+from time import perf_counter_ns
+from weakref import WeakKeyDictionary, WeakSet
+
+__all__ = ["ReprStats", "disable_stats", "enable_stats", "reset_stats", "stats"]
+
+ReprStats = namedtuple(
+    "ReprStats",
+    "repr_calls, repr_time, repr_length, pretty_calls, pretty_time, "
+    "rich_calls, rich_time",
+)
+ReprStats.__doc__ = """Statistics for the instances of one class, see
+:func:`~represent.instrumentation.stats`.
+
+Times are in seconds, and `repr_length` is the total number of characters
+returned by :code:`__repr__`.
+
+.. versionadded:: 2.3.0
+"""
+
+# Method name -> index of its calls in the statistics for a class.
+_INSTRUMENTED = {"__repr__": 0, "_repr_pretty_": 3, "__rich_repr__": 5}
+
+# Classes which represent has installed methods on.
+_classes = WeakSet()
+
+# Class -> list of values for ReprStats, with times in nanoseconds.
+_stats = WeakKeyDictionary()
+
+# Guards updates to _stats, which would lose counts if threads incremented
+# them at the same time. Only taken while statistics are enabled.
+_stats_lock = allocate_lock()
+
+_enabled = False
+
+
+def enable_stats():
+    """Start recording how many times the :code:`__repr__`,
+    :code:`_repr_pretty_`, and :code:`__rich_repr__` methods created by
+    represent are called, and how long they take, for each class.
+
+    Recording is also enabled when represent is imported if the
+    ``REPRESENT_STATS`` environment variable is set to ``1``. When it isn't
+    enabled, the methods aren't instrumented at all, so there is no overhead.
+
+    .. versionadded:: 2.3.0
+    """
+    global _enabled
+    if _enabled:
+        return
+    _enabled = True
+    for cls in list(_classes):
+        _instrument_class(cls)
+
+
+def disable_stats():
+    """Stop recording statistics. Statistics already recorded are kept until
+    :func:`reset_stats` is called.
+
+    .. versionadded:: 2.3.0
+    """
+    global _enabled
+    if not _enabled:
+        return
+    _enabled = False
+    for cls in list(_classes):
+        for name in _INSTRUMENTED:
+            method = vars(cls).get(name)
+            if getattr(method, "_represent_instrumented", False):
+                setattr(cls, name, _unwrap(method))
+
+
+def reset_stats():
+    """Forget the statistics recorded so far.
+
+    .. versionadded:: 2.3.0
+    """
+    with _stats_lock:
+        _stats.clear()
+
+
+def stats():
+    """Return a dict mapping classes to their :class:`ReprStats`, e.g. to
+    find which classes are most expensive to show:
+
+    .. code-block:: python
+
+        enable_stats()
+        ...
+        for cls, s in sorted(stats().items(), key=lambda item: -item[1].repr_time):
+            print(cls.__qualname__, s.repr_calls, s.repr_time)
+
+    Objects shown as part of another object created using represent are
+    included in the time of the outer object.
+
+    .. versionadded:: 2.3.0
+    """
+    with _stats_lock:
+        items = [(cls, list(values)) for cls, values in _stats.items()]
+    result = {}
+    for cls, values in items:
+        for i in (1, 4, 6):
+            values[i] /= 1e9
+        result[cls] = ReprStats(*values)
+    return result
+
+
+def register(cls):
+    """Record that represent has installed methods on `cls`, so that they
+    are instrumented while statistics are enabled.
+    """
+    _classes.add(cls)
+    if _enabled:
+        _instrument_class(cls)
+
+
+def install(cls, name, method):
+    """Set the method `name` of `cls`, instrumented if statistics are
+    enabled.
+    """
+    _classes.add(cls)
+    # The method may be taken from another class, e.g. ReprHelperMixin, which
+    # has already been instrumented.
+    method = _unwrap(method)
+    if _enabled and name in _INSTRUMENTED:
+        method = _instrument(name, method)
+    setattr(cls, name, method)
+
+
+def installed_classes():
+    """Return the classes which represent has installed methods on."""
+    return list(_classes)
+
+
+def _instrument_class(cls):
+    for name in _INSTRUMENTED:
+        method = vars(cls).get(name)
+        if getattr(method, "_represent_generated", False) and not getattr(
+            method, "_represent_instrumented", False
+        ):
+            setattr(cls, name, _instrument(name, method))
+
+
+def _unwrap(method):
+    """Return `method` without any instrumentation."""
+    while getattr(method, "_represent_instrumented", False):
+        method = method.__wrapped__
+    return method
+
+
+def _record(cls, index, elapsed, length=None):
+    with _stats_lock:
+        values = _stats.get(cls)
+        if values is None:
+            values = _stats[cls] = [0] * len(ReprStats._fields)
+        values[index] += 1
+        values[index + 1] += elapsed
+        if length is not None:
+            values[index + 2] += length
+
+
+def _instrument(name, method):
+    index = _INSTRUMENTED[name]
+
+    if name == "__repr__":
+
+        def wrapper(self):
+            start = perf_counter_ns()
+            result = method(self)
+            elapsed = perf_counter_ns() - start
+            _record(type(self), index, elapsed, len(result))
+            return result
+
+    elif name == "__rich_repr__":
+
+        def wrapper(self):
+            start = perf_counter_ns()
+            # Consume generators so that the time is recorded.
+            result = tuple(method(self))
+            elapsed = perf_counter_ns() - start
+            _record(type(self), index, elapsed)
+            return result
+
+    else:
+
+        def wrapper(self, *args):
+            start = perf_counter_ns()
+            result = method(self, *args)
+            elapsed = perf_counter_ns() - start
+            _record(type(self), index, elapsed)
+            return result
+
+    update_wrapper(wrapper, method)
+    wrapper._represent_generated = True
+    wrapper._represent_instrumented = True
+    return wrapper
+
+
+if os.environ.get("REPRESENT_STATS") == "1":
+    enable_stats()
@@ -0,0 +1,149 @@
+import hashlib
+from operator import attrgetter
+from weakref import WeakKeyDictionary
+
+from .core import _represent_info, _uses_represent
+from .helper import DictReprHelper
+from .utilities import EncodingBuffer, repr_into, safe_getattr
+
+__all__ = ["fingerprint", "key"]
+
+# Values of these types are used in keys as they are. Other atomic types are
+# tagged with their type, because e.g. 1 == 1.0 == True but their reprs
+# differ.
+_PLAIN_TYPES = frozenset({str, bytes, type(None), type(Ellipsis)})
+
+_NUMBER_TYPES = frozenset({bool, int, float, complex})
+
+_CONTAINER_TYPES = frozenset({list, tuple, dict, set, frozenset})
+
+# Class -> function returning the values of the fields shown by its repr, or
+# None if the class doesn't use represent.
+_getters = WeakKeyDictionary()
+
+_missing = object()
+
+
+def key(obj):
+    """Return a hashable tuple of the values shown by the repr of `obj`,
+    which can be used as a cache or deduplication key instead of
+    :func:`repr`:
+
+    .. code-block:: python
+
+        seen = set()
+        for event in events:
+            k = key(event)
+            if k not in seen:
+                seen.add(k)
+                process(event)
+
+    For objects using :func:`~represent.core.autorepr` or
+    :class:`~represent.core.ReprHelperMixin`, the key contains the class and
+    the key of each field, read using the attributes recorded for the class,
+    so no strings are built. Lists, tuples, dicts, and sets are converted to
+    tuples (or frozensets) of the keys of their items, and numbers are tagged
+    with their type. Other hashable values are used as they are, and the repr
+    of unhashable values is used instead.
+
+    Recursive references are replaced by :data:`Ellipsis`.
+
+    .. versionadded:: 2.3.0
+    """
+    return _key(obj, set())
+
+
+def fingerprint(obj, algorithm="sha256"):
+    """Return the hex digest of the repr of `obj`, encoded as UTF-8, using
+    the :mod:`hashlib` `algorithm`.
+
+    The result is the same as hashing :code:`repr(obj)`, but for objects
+    using :func:`~represent.core.autorepr` or
+    :class:`~represent.core.ReprHelperMixin` the repr is hashed in chunks as
+    it is produced, so the whole string never exists in memory at once.
+
+    .. versionadded:: 2.3.0
+    """
+    digest = hashlib.new(algorithm)
+    buffer = EncodingBuffer(digest.update, errors="surrogatepass")
+    repr_into(obj, buffer)
+    buffer.flush()
+    return digest.hexdigest()
+
+
+def _key(value, active):
+    cls = type(value)
+    if cls in _PLAIN_TYPES:
+        return value
+    if cls in _NUMBER_TYPES:
+        return (cls, value)
+
+    getter = _getters.get(cls, _missing)
+    if getter is _missing:
+        getter = _getters[cls] = _make_getter(cls)
+
+    if getter is None and cls not in _CONTAINER_TYPES:
+        try:
+            hash(value)
+        except TypeError:
+            return (cls, repr(value))
+        return value
+
+    # Only objects which can contain themselves need to be tracked.
+    value_id = id(value)
+    if value_id in active:
+        return ...
+    active.add(value_id)
+    try:
+        if getter is not None:
+            fields = getter(value)
+        elif cls is dict:
+            return (
+                cls,
+                *[(_key(k, active), _key(v, active)) for k, v in value.items()],
+            )
+        elif cls is set or cls is frozenset:
+            return (cls, frozenset(_key(item, active) for item in value))
+        else:
+            fields = value
+        return (cls, *[_key(field, active) for field in fields])
+    finally:
+        active.discard(value_id)
+
+
+def _make_getter(cls):
+    """Return a function returning the field values of instances of `cls`,
+    or None if it doesn't use represent.
+    """
+    if not _uses_represent(cls):
+        return None
+
+    safe = getattr(cls, "_represent_safe", False)
+    info = _represent_info(cls)
+    if info is None:
+        return _helper_getter(safe)
+
+    attrs = [*info.args, *(attr for _, attr in info.kw)]
+    if safe:
+        return lambda obj: [safe_getattr(obj, attr) for attr in attrs]
+    if not attrs:
+        return lambda obj: ()
+    if len(attrs) == 1:
+        # attrgetter only returns a tuple for more than one attribute.
+        get = attrgetter(attrs[0])
+        return lambda obj: (get(obj),)
+    return attrgetter(*attrs)
+
+
+def _helper_getter(safe):
+    """Return a function which calls :code:`_repr_helper_` to find the
+    ``(name, value)`` pairs, for classes whose calls couldn't be recorded.
+    The names are included, since they may differ between instances.
+    """
+
+    def get(obj):
+        r = DictReprHelper(obj, safe)
+        obj._repr_helper_(r)
+        return r
+
+    return get
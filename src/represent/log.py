@@ -0,0 +1,113 @@
+import logging
+
+from .bounded import bounded_repr
+
+__all__ = ["LazyRepr", "LazyReprFilter", "lazy"]
+
+
+class LazyRepr:
+    """Defer the repr of an object until it is formatted.
+
+    Both :func:`str` and :func:`repr` return the repr of the wrapped object,
+    so it can be used with ``%s`` or ``%r`` in :mod:`logging` calls. See
+    :func:`lazy`.
+
+    .. versionadded:: 2.3.0
+    """
+
+    __slots__ = ("obj", "max_length", "max_depth")
+
+    def __init__(self, obj, max_length=None, max_depth=None):
+        self.obj = obj
+        self.max_length = max_length
+        self.max_depth = max_depth
+
+    def __repr__(self):
+        if self.max_length is None and self.max_depth is None:
+            return repr(self.obj)
+        return bounded_repr(
+            self.obj, max_length=self.max_length, max_depth=self.max_depth
+        )
+
+    __str__ = __repr__
+
+    def __format__(self, format_spec):
+        return format(repr(self), format_spec)
+
+
+def lazy(obj, max_length=None, max_depth=None):
+    """Return an object whose :func:`str` and :func:`repr` are the repr of
+    `obj`, computed only when needed.
+
+    Use this instead of calling :func:`repr` (or using an f-string) when
+    passing arguments to a logging call, so that nothing is computed if the
+    message is never emitted:
+
+    .. code-block:: python
+
+        log.debug('processing %s', lazy(event))
+
+    `max_length` and `max_depth` limit the output as in
+    :func:`~represent.bounded.bounded_repr`.
+
+    .. versionadded:: 2.3.0
+    """
+    return LazyRepr(obj, max_length=max_length, max_depth=max_depth)
+
+
+class LazyReprFilter(logging.Filter):
+    """:class:`logging.Filter` which limits the reprs of arguments of log
+    records using :func:`~represent.core.autorepr` or
+    :class:`~represent.core.ReprHelperMixin`, as in
+    :func:`~represent.bounded.bounded_repr`:
+
+    .. code-block:: python
+
+        log.addFilter(LazyReprFilter(max_length=200))
+
+    Since filters attached to a logger only run for records at an enabled
+    level, and the arguments are wrapped with :func:`lazy`, this doesn't do
+    any work for messages which are discarded. Arguments formatted with
+    ``%s`` are still shown using :func:`str`, so only objects which don't
+    define :code:`__str__` are limited. If neither `max_length` nor
+    `max_depth` is given, records aren't changed.
+
+    .. versionadded:: 2.3.0
+    """
+
+    def __init__(self, name="", max_length=None, max_depth=None):
+        super().__init__(name)
+        self.max_length = max_length
+        self.max_depth = max_depth
+
+    def filter(self, record):
+        if not super().filter(record):
+            return False
+        if self.max_length is None and self.max_depth is None:
+            # Logging already defers formatting the arguments.
+            return True
+
+        args = record.args
+        if isinstance(args, tuple):
+            record.args = tuple(self._wrap(arg) for arg in args)
+        elif isinstance(args, dict):
+            record.args = {key: self._wrap(value) for key, value in args.items()}
+        return True
+
+    def _wrap(self, value):
+        if hasattr(type(value), "__repr_into__"):
+            return _FilteredRepr(value, self.max_length, self.max_depth)
+        return value
+
+
+class _FilteredRepr(LazyRepr):
+    """:class:`LazyRepr` whose :func:`str` is that of the object, so that
+    ``%s`` shows the same as without :class:`LazyReprFilter`.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        if type(self.obj).__str__ is object.__str__:
+            return repr(self)
+        return str(self.obj)
@@ -0,0 +1,147 @@
+from itertools import groupby
+from weakref import WeakKeyDictionary
+
+from . import formatters
+from .core import _repr_many_function
+from .utilities import EncodingBuffer, StreamBuffer, repr_into
+
+__all__ = [
+    "repr_bytes",
+    "repr_bytes_into",
+    "repr_many",
+    "write_repr",
+    "write_repr_bytes",
+]
+
+# Characters which can't be encoded are escaped, so that e.g. ASCII output
+# never fails.
+_ERRORS = "backslashreplace"
+
+# Class -> function used by repr_many for its instances. The functions
+# depend on the registered formatters, so are recreated when they change.
+_many_functions = WeakKeyDictionary()
+
+formatters.listeners.append(_many_functions.clear)
+
+
+def write_repr(obj, stream):
+    """Write the repr of `obj` to the text stream `stream`.
+
+    For objects using :func:`~represent.core.autorepr` or
+    :class:`~represent.core.ReprHelperMixin`, the repr is written in parts as
+    it is produced, so the whole string never exists in memory at once:
+
+    .. code-block:: python
+
+        with open('snapshot.txt', 'w') as f:
+            write_repr(graph, f)
+
+    Other objects are written using :func:`repr`.
+
+    .. versionadded:: 2.3.0
+    """
+    repr_into(obj, StreamBuffer(stream))
+
+
+def repr_many(iterable, sep=", "):
+    """Return the reprs of the objects in `iterable` joined by `sep`.
+
+    For large collections of objects using :func:`~represent.core.autorepr`
+    or :class:`~represent.core.ReprHelperMixin`, this is at least as fast as
+    calling :func:`repr` on a list of them. Consecutive objects of the same
+    class are shown by a function compiled once per class, which loops over
+    them without calling a method for each:
+
+    .. code-block:: python
+
+        print(repr_many(events, sep='\\n'))
+
+    .. versionadded:: 2.3.0
+    """
+    reprs = []
+    functions = {}
+    for cls, objs in groupby(iterable, type):
+        function = functions.get(cls)
+        if function is None:
+            function = functions[cls] = _many_function(cls)
+        function(objs, reprs)
+    return sep.join(reprs)
+
+
+def _many_function(cls):
+    function = _many_functions.get(cls)
+    if function is None:
+        function = _many_functions[cls] = _repr_many_function(cls)
+    return function
+
+
+def repr_bytes(obj, encoding="utf-8"):
+    """Return the repr of `obj` encoded using `encoding`, e.g. to send to a
+    socket:
+
+    .. code-block:: python
+
+        sock.sendall(repr_bytes(event) + b'\\n')
+
+    The parts of the repr are joined and encoded once, which is faster than
+    encoding each part. Characters which can't be encoded are escaped, so
+    e.g. :code:`repr_bytes(obj, 'ascii')` never fails.
+
+    .. versionadded:: 2.3.0
+    """
+    return _encode(obj, encoding)
+
+
+def repr_bytes_into(obj, buffer, offset=0, encoding="utf-8"):
+    """Write the repr of `obj`, encoded using `encoding`, into the writable
+    buffer `buffer` (e.g. a :class:`memoryview` of preallocated memory)
+    starting at `offset`, and return the number of bytes written.
+
+    A :class:`bytearray` is extended if needed, so
+    :code:`repr_bytes_into(obj, data, len(data))` appends to `data`. For
+    other buffers, :class:`ValueError` is raised if the repr doesn't fit,
+    and nothing is written. :class:`ValueError` is also raised if `offset`
+    is negative or past the end of `buffer`.
+
+    .. code-block:: python
+
+        buffer = bytearray(4096)
+        n = repr_bytes_into(event, buffer)
+        sock.sendall(memoryview(buffer)[:n])
+
+    .. versionadded:: 2.3.0
+    """
+    if not isinstance(buffer, bytearray):
+        buffer = memoryview(buffer).cast("B")
+    if not 0 <= offset <= len(buffer):
+        raise ValueError(f"offset {offset} is outside buffer of size {len(buffer)}")
+
+    data = _encode(obj, encoding)
+    end = offset + len(data)
+    if not isinstance(buffer, bytearray):
+        if end > len(buffer):
+            raise ValueError("repr doesn't fit in buffer")
+    buffer[offset:end] = data
+    return len(data)
+
+
+def write_repr_bytes(obj, stream, encoding="utf-8"):
+    """Write the repr of `obj`, encoded using `encoding`, to the binary
+    stream `stream`, e.g. a file opened with ``'wb'`` or
+    :meth:`socket.socket.makefile`.
+
+    Like :func:`write_repr`, the repr is written as it is produced, so the
+    whole string never exists in memory at once. Parts are collected into
+    chunks which are encoded and written together.
+
+    .. versionadded:: 2.3.0
+    """
+    buffer = EncodingBuffer(stream.write, encoding, _ERRORS)
+    repr_into(obj, buffer)
+    buffer.flush()
+
+
+def _encode(obj, encoding):
+    parts = []
+    repr_into(obj, parts)
+    return "".join(parts).encode(encoding, _ERRORS)
@@ -0,0 +1,120 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+from . import formatters
+from .output import repr_many
+
+__all__ = ["write_repr_parallel"]
+
+
+def write_repr_parallel(
+    iterable,
+    stream,
+    sep=", ",
+    chunksize=10_000,
+    *,
+    threads=False,
+    max_workers=None,
+    executor=None,
+):
+    """Write the reprs of the objects in `iterable`, joined by `sep`, to the
+    text stream `stream` using multiple processes.
+
+    The objects are split into chunks of `chunksize`, which are rendered by
+    :func:`~represent.output.repr_many` in a
+    :class:`~concurrent.futures.ProcessPoolExecutor`. Chunks are written in
+    order as soon as they are ready, and only a few chunks per worker are
+    submitted at a time, so `iterable` can be a generator of more objects
+    than fit in memory:
+
+    .. code-block:: python
+
+        with open('snapshot.txt', 'w') as f:
+            write_repr_parallel(events, f, sep='\\n')
+
+    The objects must be picklable to be sent to the worker processes. The
+    formatters registered using
+    :func:`~represent.formatters.register_formatter` are also sent, so that
+    the output is the same as :func:`~represent.output.repr_many` however
+    the processes are started, which means they must be picklable too unless
+    the processes are forked. On free-threaded builds of Python,
+    ``threads=True`` uses a :class:`~concurrent.futures.ThreadPoolExecutor`
+    instead, which avoids pickling. An existing `executor` may also be
+    passed, in which case it isn't shut down.
+
+    :param int chunksize: Number of objects rendered by each task.
+    :param bool threads: Use threads rather than processes.
+    :param int max_workers: Number of workers for the pool created.
+
+    .. versionadded:: 2.3.0
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    # Enough chunks to keep the workers busy while earlier ones are written.
+    max_pending = 2 * (max_workers or os.cpu_count() or 1)
+
+    if executor is not None:
+        # The worker processes may have been started before formatters were
+        # registered, so send them with each chunk.
+        registry = None
+        if isinstance(executor, ProcessPoolExecutor):
+            registry = dict(formatters.registry)
+        _write_chunks(executor, iterable, stream, sep, chunksize, max_pending, registry)
+        return
+
+    if threads:
+        pool = ThreadPoolExecutor(max_workers)
+    else:
+        # Processes which aren't forked don't inherit the formatters.
+        pool = ProcessPoolExecutor(
+            max_workers,
+            initializer=_set_formatters,
+            initargs=(dict(formatters.registry),),
+        )
+    with pool:
+        _write_chunks(pool, iterable, stream, sep, chunksize, max_pending)
+
+
+def _set_formatters(registry):
+    """Make the formatters registered in this process the same as those in
+    `registry`.
+    """
+    if formatters.registry != registry:
+        formatters.registry.clear()
+        formatters.registry.update(registry)
+        formatters._changed()
+
+
+def _repr_chunk(chunk, sep, registry):
+    _set_formatters(registry)
+    return repr_many(chunk, sep)
+
+
+def _write_chunks(
+    executor, iterable, stream, sep, chunksize, max_pending, registry=None
+):
+    iterator = iter(iterable)
+    pending = deque()
+    first = True
+
+    def write_next():
+        nonlocal first
+        chunk = pending.popleft().result()
+        if not first:
+            stream.write(sep)
+        first = False
+        stream.write(chunk)
+
+    while chunk := list(islice(iterator, chunksize)):
+        if len(pending) >= max_pending:
+            write_next()
+        if registry is None:
+            pending.append(executor.submit(repr_many, chunk, sep))
+        else:
+            pending.append(executor.submit(_repr_chunk, chunk, sep, registry))
+
+    while pending:
+        write_next()
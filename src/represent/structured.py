@@ -0,0 +1,132 @@
+import json
+from weakref import WeakKeyDictionary
+
+from .core import _create_fn, _represent_info, _uses_represent
+from .formatters import find_formatter, registry
+from .helper import DictReprHelper
+from .utilities import safe_getattr
+
+__all__ = ["json_default", "to_dict", "write_json_lines"]
+
+# Class -> function returning the fields of its instances as a dict, or None
+# if the class doesn't use represent.
+_converters = WeakKeyDictionary()
+
+_missing = object()
+
+
+def to_dict(obj):
+    """Return a dict of the arguments shown by the repr of `obj`, which uses
+    :func:`~represent.core.autorepr` or
+    :class:`~represent.core.ReprHelperMixin`, mapping their names to their
+    values, e.g. ``{'name': 'Timothy', 'width': 15}`` for
+    ``Rectangle('Timothy', width=15)``.
+
+    Positional arguments are named after their attribute, or by their
+    position if added using ``positional_with_value``. Values aren't
+    converted, so nested objects are included as they are.
+
+    The function creating the dict is compiled from the attributes used by
+    the repr, once per class. Classes whose :code:`_repr_helper_` calls
+    couldn't be recorded call it using a
+    :class:`~represent.helper.DictReprHelper` instead.
+
+    :raises TypeError: if `obj` doesn't use represent.
+
+    .. versionadded:: 2.3.0
+    """
+    convert = _converter(type(obj))
+    if convert is None:
+        raise TypeError(
+            f"{type(obj).__qualname__} doesn't use autorepr or ReprHelperMixin"
+        )
+    return convert(obj)
+
+
+def json_default(obj):
+    """Convert `obj` to a value that :mod:`json` can encode, for use as the
+    `default` argument of :func:`json.dumps` or a structured logger's JSON
+    renderer:
+
+    .. code-block:: python
+
+        json.dumps(event, default=json_default)
+
+    Objects using represent become a dict of their arguments (see
+    :func:`to_dict`) with their class name as ``'__class__'``. Sets become
+    lists, and other values become the string shown for them in a repr.
+
+    .. versionadded:: 2.3.0
+    """
+    cls = type(obj)
+    convert = _converter(cls)
+    if convert is not None:
+        return {"__class__": cls.__name__, **convert(obj)}
+    if cls is set or cls is frozenset:
+        return list(obj)
+    if registry:
+        func = find_formatter(cls)
+        if func is not None:
+            return func(obj)
+    return repr(obj)
+
+
+_encoder = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), default=json_default
+)
+
+
+def write_json_lines(iterable, stream):
+    """Write each object in `iterable` to the text stream `stream` as a line
+    of compact JSON, converting objects using :func:`json_default`:
+
+    .. code-block:: python
+
+        with open('events.jsonl', 'w') as f:
+            write_json_lines(events, f)
+
+    .. code-block:: none
+
+        {"__class__":"Event","name":"start","tags":["a","b"]}
+
+    .. versionadded:: 2.3.0
+    """
+    encode = _encoder.encode
+    write = stream.write
+    for obj in iterable:
+        write(encode(obj))
+        write("\n")
+
+
+def _converter(cls):
+    convert = _converters.get(cls, _missing)
+    if convert is _missing:
+        convert = _converters[cls] = _make_converter(cls)
+    return convert
+
+
+def _make_converter(cls):
+    if not _uses_represent(cls):
+        return None
+
+    safe = getattr(cls, "_represent_safe", False)
+    info = _represent_info(cls)
+    if info is None:
+
+        def convert(obj):
+            r = DictReprHelper(obj, safe)
+            obj._repr_helper_(r)
+            return dict(r)
+
+        return convert
+
+    namespace = {}
+    if safe:
+        namespace["safe_getattr"] = safe_getattr
+        load = "safe_getattr(self, {!r})".format
+    else:
+        load = "self.{}".format
+    items = [f"{attr!r}: {load(attr)}" for attr in info.args]
+    items.extend(f"{keyword!r}: {load(attr)}" for keyword, attr in info.kw)
+    body = [f"return {{{', '.join(items)}}}"]
+    return _create_fn(cls, "_to_dict", ["self"], body, namespace=namespace)
@@ -1,4 +1,10 @@
+from _thread import get_ident
 from collections import namedtuple
+from contextvars import ContextVar
+from functools import update_wrapper
+from types import MemberDescriptorType
+
+from .formatters import find_formatter, registry
 
 
 def inherit_docstrings(cls):
@@ -18,4 +24,348 @@ def inherit_docstrings(cls):
 
 
 Parantheses = namedtuple("Parantheses", "left, right")
-ReprInfo = namedtuple("ReprInfo", "fstr, args, kw")
+
+#: Attributes shown by a generated repr. `args` are attribute names shown as
+#: positional arguments and `kw` are ``(keyword, attribute name)`` pairs.
+#: `defaults` maps the attribute names of keyword arguments which are omitted
+#: when their value is the default to that default, or is None.
+ReprInfo = namedtuple(
+    "ReprInfo",
+    "args, kw, parantheses, defaults",
+    defaults=(Parantheses("(", ")"), None),
+)
+
+
+def is_default(value, default):
+    """Return True if `value` is `default`, or equal to it and of the same
+    type (so that e.g. ``1.0`` isn't omitted when the default is ``1``).
+
+    Identity is checked first, since values are usually the default object
+    itself.
+    """
+    return value is default or (type(value) is type(default) and value == default)
+
+
+class _RunningReprs(set):
+    """Ids of the objects whose repr is being computed.
+
+    `fills` is incremented each time recursion is detected, so callers can
+    tell whether a repr was affected by where the recursion started.
+    `thread` is the id of the thread which created it.
+    """
+
+    __slots__ = ("fills", "thread")
+
+    def __init__(self):
+        super().__init__()
+        self.fills = 0
+        self.thread = get_ident()
+
+
+#: The :class:`_RunningReprs` for the current context, created the first
+#: time it is needed and then reused, so top-level reprs don't need to set
+#: and reset the variable. Using a context variable rather than the thread id
+#: means greenlets and asyncio tasks sharing a thread don't see each other's
+#: objects. A copied context (e.g. one inherited by a new thread) would share
+#: the set, so it is replaced if it was created by another thread.
+_repr_running = ContextVar("represent_repr_running", default=None)
+
+#: Types whose repr can't contain other objects, so can't be recursive.
+ATOMIC_TYPES = frozenset(
+    {type(None), bool, int, float, complex, str, bytes, type(Ellipsis)}
+)
+
+
+def running_reprs():
+    """Return the :class:`_RunningReprs` for the current context."""
+    running = _repr_running.get()
+    if running is None or running.thread != get_ident():
+        running = _RunningReprs()
+        _repr_running.set(running)
+    return running
+
+
+def recursive_repr(fillvalue="..."):
+    """Decorator for :code:`__repr__` methods which returns `fillvalue`
+    instead of recursing forever, like :func:`reprlib.recursive_repr`.
+    """
+
+    def decorating_function(user_function):
+        def wrapper(self):
+            key = id(self)
+            # Inlined running_reprs
+            running = _repr_running.get()
+            if running is None or running.thread != get_ident():
+                running = _RunningReprs()
+                _repr_running.set(running)
+            elif key in running:
+                running.fills += 1
+                return fillvalue
+            running.add(key)
+            try:
+                return user_function(self)
+            finally:
+                running.discard(key)
+
+        return update_wrapper(wrapper, user_function)
+
+    return decorating_function
+
+
+def recursive_repr_into(fillvalue="..."):
+    """Decorator for :code:`__repr_into__` methods which appends `fillvalue`
+    instead of recursing forever, like :func:`reprlib.recursive_repr`.
+
+    Extra arguments after the buffer are passed through to the decorated
+    function.
+    """
+
+    def decorating_function(user_function):
+        def wrapper(self, buffer, *args):
+            key = id(self)
+            # Inlined running_reprs
+            running = _repr_running.get()
+            if running is None or running.thread != get_ident():
+                running = _RunningReprs()
+                _repr_running.set(running)
+            elif key in running:
+                running.fills += 1
+                buffer.append(fillvalue)
+                return
+            running.add(key)
+            try:
+                user_function(self, buffer, *args)
+            finally:
+                running.discard(key)
+
+        return update_wrapper(wrapper, user_function)
+
+    return decorating_function
+
+
+def repr_into(value, buffer):
+    """Append the repr of `value` to `buffer`.
+
+    Objects whose :code:`__repr__` was created by represent append their repr
+    using their :code:`__repr_into__` method, so nested objects share one
+    buffer instead of each building a string which is then copied by its
+    parent. Lists, tuples, and dicts are expanded if they contain such
+    objects. Other values are appended using :func:`repr`.
+
+    Values with a formatter registered using
+    :func:`~represent.formatters.register_formatter` use it instead.
+    """
+    cls = type(value)
+    if registry:
+        func = find_formatter(cls)
+        if func is not None:
+            buffer.append(func(value))
+            return
+    if cls in _container_into:
+        if _has_repr_into(value):
+            _container_into[cls](value, buffer)
+            return
+    elif cls not in ATOMIC_TYPES:
+        # Inlined repr_into_method
+        into = getattr(cls, "__repr_into__", None)
+        if into is not None and getattr(cls.__repr__, "_represent_generated", False):
+            into(value, buffer)
+            return
+    buffer.append(repr(value))
+
+
+def repr_into_method(cls):
+    """Return the :code:`__repr_into__` method of `cls`, or None if it
+    doesn't have one or it could differ from :code:`__repr__`, e.g. because
+    a subclass overrides :code:`__repr__`.
+    """
+    into = getattr(cls, "__repr_into__", None)
+    if into is not None and getattr(cls.__repr__, "_represent_generated", False):
+        return into
+    return None
+
+
+def is_plain(container, atomic):
+    """Return True if the items (and keys) of the list, tuple, or dict
+    `container` all have types in `atomic`, so that its repr can't be
+    recursive and can be computed by :func:`repr`.
+    """
+    if type(container) is dict:
+        return atomic.issuperset(map(type, container)) and atomic.issuperset(
+            map(type, container.values())
+        )
+    return atomic.issuperset(map(type, container))
+
+
+def _has_repr_into(container, seen=None):
+    """Return True if `container` has an item (at any depth) which
+    :func:`repr_into` wouldn't append using :func:`repr`.
+
+    `seen` holds the ids of the containers being checked, so that recursive
+    containers are only checked once.
+    """
+    items = container.values() if type(container) is dict else container
+    # Check distinct types rather than each item.
+    types = set(map(type, items))
+    if type(container) is dict:
+        types.update(map(type, container))
+    if registry and any(find_formatter(t) is not None for t in types):
+        return True
+    if types <= ATOMIC_TYPES:
+        return False
+    if any(t not in _container_into and repr_into_method(t) is not None for t in types):
+        return True
+    if types.isdisjoint(_container_into):
+        return False
+
+    if seen is None:
+        seen = set()
+    seen.add(id(container))
+    nested = [item for item in items if type(item) in _container_into]
+    if type(container) is dict:
+        nested.extend(k for k in container if type(k) in _container_into)
+    return any(id(item) not in seen and _has_repr_into(item, seen) for item in nested)
+
+
+@recursive_repr_into("[...]")
+def _list_into(value, buffer):
+    append = buffer.append
+    append("[")
+    for i, item in enumerate(value):
+        if i:
+            append(", ")
+        repr_into(item, buffer)
+    append("]")
+
+
+def _tuple_into(value, buffer):
+    append = buffer.append
+    append("(")
+    for i, item in enumerate(value):
+        if i:
+            append(", ")
+        repr_into(item, buffer)
+    append(",)" if len(value) == 1 else ")")
+
+
+@recursive_repr_into("{...}")
+def _dict_into(value, buffer):
+    append = buffer.append
+    append("{")
+    for i, (key, item) in enumerate(value.items()):
+        if i:
+            append(", ")
+        repr_into(key, buffer)
+        append(": ")
+        repr_into(item, buffer)
+    append("}")
+
+
+_container_into = {list: _list_into, tuple: _tuple_into, dict: _dict_into}
+
+
+class _NotLoaded:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<not loaded>"
+
+
+#: Shown by safe reprs in place of attributes that can't be read without
+#: calling a descriptor, such as a property.
+NOT_LOADED = _NotLoaded()
+
+
+def safe_getattr(obj, name):
+    """Return the attribute `name` of `obj` from its :code:`__dict__` or
+    slots, without calling properties or other descriptors which may have
+    side effects (e.g. lazy loading a relationship from a database).
+
+    Returns :data:`NOT_LOADED` if the attribute can't be read this way.
+    """
+    try:
+        instance_dict = object.__getattribute__(obj, "__dict__")
+    except AttributeError:
+        pass
+    else:
+        try:
+            return instance_dict[name]
+        except KeyError:
+            pass
+
+    cls = type(obj)
+    for base in cls.__mro__:
+        try:
+            attr = vars(base)[name]
+        except KeyError:
+            continue
+        if type(attr) is MemberDescriptorType:
+            try:
+                return attr.__get__(obj, cls)
+            except AttributeError:
+                return NOT_LOADED
+        if hasattr(type(attr), "__get__"):
+            return NOT_LOADED
+        # A plain class attribute, e.g. a default value.
+        return attr
+    return NOT_LOADED
+
+
+def safe_repr_into(value, buffer):
+    """Like :func:`repr_into`, but if the repr of `value` raises an
+    exception, append the default repr from :class:`object` instead.
+    """
+    parts = []
+    try:
+        repr_into(value, parts)
+    except Exception:
+        parts = [object.__repr__(value)]
+    for part in parts:
+        buffer.append(part)
+
+
+class StreamBuffer:
+    """Adapt a text stream to the buffer interface used by
+    :code:`__repr_into__`, so that parts are written as they are produced.
+    """
+
+    __slots__ = ("append",)
+
+    def __init__(self, stream):
+        self.append = stream.write
+
+
+# Number of characters collected by EncodingBuffer before they are encoded.
+_CHUNK_SIZE = 1 << 16
+
+
+class EncodingBuffer:
+    """Adapt a function accepting bytes, e.g. the :code:`write` method of a
+    binary stream, to the buffer interface used by :code:`__repr_into__`.
+
+    Parts are collected until there are enough characters to encode them
+    efficiently as one chunk, so call :meth:`flush` once the repr is
+    complete.
+    """
+
+    __slots__ = ("_write", "_encoding", "_errors", "_parts", "_size")
+
+    def __init__(self, write, encoding="utf-8", errors="strict"):
+        self._write = write
+        self._encoding = encoding
+        self._errors = errors
+        self._parts = []
+        self._size = 0
+
+    def append(self, part):
+        self._parts.append(part)
+        self._size += len(part)
+        if self._size >= _CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self._parts:
+            text = "".join(self._parts)
+            self._write(text.encode(self._encoding, self._errors))
+            self._parts.clear()
+            self._size = 0
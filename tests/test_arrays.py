@@ -0,0 +1,75 @@
+import pytest
+from IPython.lib.pretty import pretty
+from rich.pretty import pretty_repr
+
+from represent import (
+    PrettyReprHelper,
+    ReprHelper,
+    RichReprHelper,
+    autorepr,
+    summarize_arrays,
+    unregister_formatter,
+)
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def summarize():
+    summarize_arrays(threshold=5)
+    yield
+    unregister_formatter(np.ndarray)
+
+
+@autorepr
+class A:
+    def __init__(self, a):
+        self.a = a
+
+
+class B:
+    def __init__(self, a):
+        self.a = a
+
+    def _repr_helper(self, r):
+        r.keyword_from_attr("a")
+
+    def __repr__(self):
+        r = ReprHelper(self)
+        self._repr_helper(r)
+        return str(r)
+
+    def _repr_pretty_(self, p, cycle):
+        with PrettyReprHelper(self, p, cycle) as r:
+            self._repr_helper(r)
+
+    def __rich_repr__(self):
+        r = RichReprHelper(self)
+        self._repr_helper(r)
+        yield from r
+
+
+@pytest.mark.parametrize("cls", [A, B])
+def test_summarize_arrays(summarize, cls):
+    obj = cls(np.arange(12.0).reshape(3, 4))
+    summary = (
+        "<ndarray shape=(3, 4) dtype=float64 min=0.0 max=11.0 mean=5.5 "
+        "[0.0, 1.0, 2.0, ..., 9.0, 10.0, 11.0]>"
+    )
+    assert repr(obj) == f"{cls.__name__}(a={summary})"
+    assert pretty(obj) == f"{cls.__name__}(a={summary})"
+    assert pretty_repr(obj, max_width=200) == f"{cls.__name__}(a={summary})"
+
+    # Small arrays use their usual repr.
+    assert repr(cls(np.arange(5))) == f"{cls.__name__}(a=array([0, 1, 2, 3, 4]))"
+
+
+def test_summarize_arrays_dtypes(summarize):
+    strided = np.arange(100, dtype=np.int64)[::10]
+    assert repr(A(strided)) == (
+        "A(a=<ndarray shape=(10,) dtype=int64 min=0 max=90 mean=45.0 "
+        "[0, 10, 20, ..., 70, 80, 90]>)"
+    )
+    assert repr(A(np.array(list("abcdef")))) == (
+        "A(a=<ndarray shape=(6,) dtype=<U1 ['a', 'b', 'c', 'd', 'e', 'f']>)"
+    )
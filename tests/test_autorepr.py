@@ -1,3 +1,11 @@
+import contextvars
+import functools
+import hashlib
+import inspect
+import io
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import partial
 from unittest.mock import Mock, patch
@@ -6,7 +14,16 @@ import pytest
 from IPython.lib.pretty import pretty
 from rich.pretty import pretty_repr
 
-from represent import autorepr
+import represent.core
+from represent import (
+    ReprHelperMixin,
+    autorepr,
+    bounded_repr,
+    fingerprint,
+    repr_many,
+    write_repr,
+)
+from represent.core import _getdefaults, _getparams
 
 
 class WrappedMethod:
@@ -210,7 +227,7 @@ def test_reuse():
 
 
 def test_recursive_repr():
-    """Test that autorepr applies the :func:`reprlib.recursive_repr` decorator."""
+    """Test that autorepr shows recursive references as ``...``."""
 
     @autorepr
     class A:
@@ -224,6 +241,54 @@ def test_recursive_repr():
     assert repr(a) == reprstr
 
 
+def test_recursive_repr_context():
+    """Test that reprs running in other contexts, e.g. greenlets or asyncio
+    tasks sharing a thread, aren't mistaken for recursion.
+    """
+
+    @autorepr
+    class A:
+        def __init__(self, a=None):
+            self.a = a
+
+    class Switch:
+        switched = False
+
+        def __repr__(self):
+            if self.switched:
+                return "switch"
+            self.switched = True
+            return contextvars.Context().run(repr, a)
+
+    a = A(Switch())
+    assert repr(a) == "A(a=A(a=switch))"
+
+
+def test_recursive_repr_copied_context():
+    """Test that reprs in other threads which were given a copy of the
+    current context aren't mistaken for recursion.
+    """
+
+    @autorepr
+    class A:
+        def __init__(self, a=None):
+            self.a = a
+
+    class Switch:
+        switched = False
+
+        def __repr__(self):
+            if self.switched:
+                return "switch"
+            self.switched = True
+            context = contextvars.copy_context()
+            with ThreadPoolExecutor(1) as executor:
+                return executor.submit(context.run, repr, a).result()
+
+    a = A(Switch())
+    assert repr(a) == "A(a=A(a=switch))"
+
+
 @pytest.mark.parametrize("include_pretty", [False, True])
 def test_include_pretty(include_pretty):
     @autorepr(include_pretty=include_pretty)
@@ -266,3 +331,387 @@ def test_include_rich(include_rich):
         # broken _repr_pretty_ on the class)
         assert pretty_repr(a) == reprstr
         assert not hasattr(A, "__rich_repr__")
+
+
+def test_compiled_repr():
+    @autorepr(positional=1)
+    class A:
+        def __init__(self, a, b, *, c):
+            self.a = a
+            self.b = b
+            self.c = c
+
+    a = A("x", [1, 2], c={"k": None})
+    assert repr(a) == "A('x', b=[1, 2], c={'k': None})"
+    assert A.__repr__.__qualname__ == "test_compiled_repr.<locals>.A.__repr__"
+    assert A.__repr__.__module__ == __name__
+
+    # Attributes are looked up each time, not when the class is decorated.
+    a.b = "changed"
+    assert repr(a) == "A('x', b='changed', c={'k': None})"
+
+    class B(A):
+        pass
+
+    assert repr(B(1, 2, c=3)) == "B(1, b=2, c=3)"
+
+
+def test_compiled_pretty_and_rich():
+    @autorepr(positional=1)
+    class A:
+        def __init__(self, a, b):
+            self.a = a
+            self.b = b
+
+    a = A((1, 2), "b")
+    assert pretty(a) == "A((1, 2), b='b')"
+    assert pretty_repr(a) == "A((1, 2), b='b')"
+    assert A.__rich_repr__(a) == ((None, (1, 2)), ("b", "b"))
+
+    a = A("x" * 70, [A(1, 2)])
+    prettystr = """
+    A('xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx',
+      b=[A(1, b=2)])"""
+    assert pretty(a) == textwrap.dedent(prettystr).lstrip()
+
+    assert A._repr_pretty_.__qualname__.endswith("A._repr_pretty_")
+    assert A.__rich_repr__.__qualname__.endswith("A.__rich_repr__")
+
+
+def test_repr_into():
+    @autorepr(positional=1)
+    class A:
+        def __init__(self, a, b=None):
+            self.a = a
+            self.b = b
+
+    a = A(1, [A(2), (A(3),), {"k": A(4)}, [5], (), (6,)])
+    buffer = []
+    a.__repr_into__(buffer)
+    assert "".join(buffer) == repr(a)
+    assert repr(a) == (
+        "A(1, b=[A(2, b=None), (A(3, b=None),), {'k': A(4, b=None)}, [5], (), (6,)])"
+    )
+    # Nested objects are appended to the same buffer rather than joined
+    assert buffer[:5] == ["A(", "1", ", b=", "[", "A(2, b=None)"]
+
+    # Recursion through containers
+    a = A([], {})
+    a.a.append(a.a)
+    a.a.append(a)
+    a.b["a"] = a
+    assert repr(a) == "A([[...], ...], b={'a': ...})"
+
+
+def test_repr_into_overridden_repr():
+    """Test that subclasses which override __repr__ aren't shown using the
+    inherited __repr_into__.
+    """
+
+    @autorepr
+    class A:
+        def __init__(self, a, b=None):
+            self.a = a
+            self.b = b
+
+    class B(A):
+        def __repr__(self):
+            return "CUSTOM"
+
+    class C(ReprHelperMixin):
+        def __init__(self, a):
+            self.a = a
+
+        def _repr_helper_(self, r):
+            r.positional_from_attr("a")
+
+    class D(C):
+        def __repr__(self):
+            return "CUSTOM"
+
+    for obj in [B(1), D(1)]:
+        assert repr(A(obj)) == "A(a=CUSTOM, b=None)"
+        assert repr(A([obj], {1: obj})) == "A(a=[CUSTOM], b={1: CUSTOM})"
+        assert repr(C(obj)) == "C(CUSTOM)"
+
+        stream = io.StringIO()
+        write_repr(obj, stream)
+        assert stream.getvalue() == "CUSTOM"
+        assert repr_many([obj, A(obj)]) == "CUSTOM, A(a=CUSTOM, b=None)"
+        assert fingerprint(obj) == hashlib.sha256(b"CUSTOM").hexdigest()
+
+
+def _signatures():
+    class Plain:
+        def __init__(self, a, /, b, *args, c, d=1, **kwargs):
+            pass
+
+    class NoArgs:
+        def __init__(self):
+            pass
+
+    class Defaults:
+        def __init__(self, a, b=2, c=None, *args, d, e=(), **kwargs):
+            pass
+
+    class Inherited(Plain):
+        pass
+
+    class Meta(type):
+        def __call__(cls, x, y):
+            pass
+
+    class WithMeta(metaclass=Meta):
+        def __init__(self, a):
+            pass
+
+    class New:
+        def __new__(cls, a, b):
+            pass
+
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            return f(*args, **kwargs)
+
+        return wrapper
+
+    class Wrapped:
+        @decorator
+        def __init__(self, a, *, b):
+            pass
+
+    class Missing:
+        pass
+
+    return [Plain, NoArgs, Defaults, Inherited, WithMeta, New, Wrapped, Missing]
+
+
+@pytest.mark.parametrize("cls", _signatures(), ids=lambda cls: cls.__name__)
+def test_getparams(cls):
+    """Test that parameters are found in the same order as inspect."""
+    signature = inspect.signature(cls)
+    params, kwonly = _getparams(cls)
+    assert list(params) == list(signature.parameters)
+    assert set(kwonly) == {
+        p.name
+        for p in signature.parameters.values()
+        if p.kind == inspect.Parameter.KEYWORD_ONLY
+    }
+
+
+@pytest.mark.parametrize("cls", _signatures(), ids=lambda cls: cls.__name__)
+def test_getdefaults(cls):
+    signature = inspect.signature(cls)
+    assert _getdefaults(cls) == {
+        p.name: p.default
+        for p in signature.parameters.values()
+        if p.default is not inspect.Parameter.empty
+    }
+
+
+def test_lazy_compile():
+    @autorepr
+    class A:
+        def __init__(self, a):
+            self.a = a
+
+    # Methods are compiled when they are first used.
+    assert "_represent_methods" not in vars(A)
+    a = A(1)
+    assert pretty(a) == "A(a=1)"
+    assert A.__repr__ is A._represent_methods["__repr__"]
+    assert repr(a) == "A(a=1)"
+
+
+def test_inheritance():
+    @autorepr(positional="width")
+    class Rectangle:
+        def __init__(self, width, height):
+            self.width = width
+            self.height = height
+
+    class Cuboid(Rectangle):
+        def __init__(self, width, height, depth):
+            super().__init__(width, height)
+            self.depth = depth
+
+    class Labelled(Cuboid):
+        def __repr__(self):
+            return f"<{super().__repr__()}>"
+
+    class Reordered(Rectangle):
+        def __init__(self, height, width):
+            super().__init__(width, height)
+
+    assert repr(Rectangle(1, 2)) == "Rectangle(1, height=2)"
+    cuboid = Cuboid(1, 2, 3)
+    assert repr(cuboid) == "Cuboid(1, height=2, depth=3)"
+    assert pretty(cuboid) == "Cuboid(1, height=2, depth=3)"
+    assert pretty_repr(cuboid) == "Cuboid(1, height=2, depth=3)"
+    assert bounded_repr(cuboid) == "Cuboid(1, height=2, depth=3)"
+    assert Cuboid._represent.kw == [("height", "height"), ("depth", "depth")]
+
+    for _ in range(2):
+        assert repr(Labelled(1, 2, 3)) == "<Labelled(1, height=2, depth=3)>"
+
+    # 'width' can't be positional, so the parent's plan is used.
+    assert repr(Reordered(2, 1)) == "Reordered(1, height=2)"
+
+
+def test_inheritance_pass_through():
+    """Test that subclasses whose parameters aren't attributes use the plan
+    of their parent.
+    """
+
+    @autorepr
+    class A:
+        def __init__(self, a):
+            self.a = a
+
+    class B(A):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+
+    class C(A):
+        def __init__(self, value):
+            super().__init__(value)
+
+    class D(A):
+        def __init__(self, a, b):
+            super().__init__(a)
+            self.c = b
+
+    class E(A):
+        def __init__(self, a, b):
+            super().__init__(a)
+
+        @property
+        def b(self):
+            return self.a + 1
+
+    assert repr(B(1)) == "B(a=1)"
+    assert repr(C(1)) == "C(a=1)"
+    assert repr(D(1, 2)) == "D(a=1)"
+    assert repr(E(1, 2)) == "E(a=1, b=2)"
+
+
+def test_safe():
+    class Broken:
+        def __repr__(self):
+            raise RuntimeError
+
+    @autorepr(safe=True, positional=1)
+    class A:
+        __slots__ = ("a", "__dict__")
+
+        loads = 0
+
+        def __init__(self, a, b, c, d=None):
+            self._b = b
+            self.c = c
+
+        @property
+        def b(self):
+            A.loads += 1
+            return self._b
+
+    broken = Broken()
+    a = A(None, 1, broken)
+    expected = (
+        f"A(<not loaded>, b=<not loaded>, c={object.__repr__(broken)}, d=<not loaded>)"
+    )
+    assert repr(a) == expected
+    assert " ".join(pretty(a).split()) == expected
+    assert pretty_repr(a).startswith("A(<not loaded>, b=<not loaded>, c=")
+    assert bounded_repr(a).startswith("A(<not loaded>, b=<not loaded>, c=<")
+
+    a.a = 1
+    a.c = 2
+    # Atomic values use the f-string.
+    a.d = None
+    assert repr(a) == "A(1, b=<not loaded>, c=2, d=None)"
+    assert A.loads == 0
+
+    with pytest.raises(TypeError):
+        autorepr(safe=True, bogus=1)
+
+
+def test_threads():
+    @autorepr
+    class A:
+        def __init__(self, a):
+            self.a = a
+
+    class B(A):
+        pass
+
+    n = 8
+    barrier = threading.Barrier(n)
+
+    def work(i):
+        barrier.wait()
+        return [repr(A(i)), repr(B([i]))]
+
+    with (
+        patch.object(
+            represent.core,
+            "_make_compiled_repr",
+            Mock(wraps=represent.core._make_compiled_repr),
+        ) as compile_,
+        ThreadPoolExecutor(n) as executor,
+    ):
+        results = list(executor.map(work, range(n)))
+
+    assert results == [[f"A(a={i})", f"B(a=[{i}])"] for i in range(n)]
+    # Each class was compiled once, even though the threads raced.
+    assert compile_.call_count == 2
+
+
+def test_omit_defaults():
+    default = object()
+
+    @autorepr(omit_defaults=True, positional=1)
+    class A:
+        def __init__(self, a, b=1, c=None, *, d=default, e=()):
+            self.a = a
+            self.b = b
+            self.c = c
+            self.d = d
+            self.e = e
+
+    @autorepr(omit_defaults=True)
+    class B:
+        def __init__(self, a=None, b=None):
+            self.a = a
+            self.b = b
+
+    cases = [
+        (A(0), "A(0)"),
+        # Equal values of other types aren't omitted
+        (A(0, b=1.0, e=[]), "A(0, b=1.0, e=[])"),
+        (A(0, c=[1], e=()), "A(0, c=[1])"),
+        (A([A(1)], 2, 3, d=4, e=(5,)), "A([A(1)], b=2, c=3, d=4, e=(5,))"),
+        (B(), "B()"),
+        (B(b=B()), "B(b=B())"),
+        (B(a=1, b=2), "B(a=1, b=2)"),
+    ]
+    for obj, expected in cases:
+        assert repr(obj) == expected
+        assert pretty(obj) == expected
+        assert pretty_repr(obj) == expected
+        assert bounded_repr(obj) == expected
+
+    assert pretty(B(a="x" * 40, b="y" * 40)) == textwrap.dedent(
+        f"""\
+        B(a='{"x" * 40}',
+          b='{"y" * 40}')"""
+    )
+
+    # Subclasses record their own defaults
+    class C(B):
+        def __init__(self, a, b=2):
+            super().__init__(a, b)
+
+    assert repr(C(1)) == "C(a=1)"
+    assert repr(C(1, None)) == "C(a=1, b=None)"
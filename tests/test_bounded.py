@@ -0,0 +1,167 @@
+import pytest
+
+from represent import BoundedReprHelper, ReprHelperMixin, autorepr, bounded_repr
+
+
+@autorepr
+class A:
+    def __init__(self, a, b=None):
+        self.a = a
+        self.b = b
+
+
+class B(ReprHelperMixin):
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+    def _repr_helper_(self, r):
+        r.parantheses = ("<", ">")
+        r.positional_from_attr("a")
+        r.keyword_with_value("b", self.b, raw=True)
+
+
+def test_unbounded():
+    a = A(1, A([2, A("3")], B(4, "x")))
+    assert (
+        bounded_repr(a)
+        == repr(a)
+        == "A(a=1, b=A(a=[2, A(a='3', b=None)], b=B<4, b=x>))"
+    )
+
+
+def test_max_depth():
+    a = A(1, A([2, A("3")], B(4, "x")))
+    assert bounded_repr(a, max_depth=0) == "A(...)"
+    assert bounded_repr(a, max_depth=1) == "A(a=1, b=A(...))"
+    assert bounded_repr(a, max_depth=2) == "A(a=1, b=A(a=[...], b=B(...)))"
+    assert bounded_repr(B(A(1), "x"), max_depth=1) == "B<A(...), b=x>"
+
+
+def test_max_length():
+    a = A(list(range(100000)), "never shown")
+    reprstr = bounded_repr(a, max_length=40)
+    assert reprstr.startswith("A(a=[0, 1, 2, 3,")
+    assert reprstr.endswith("...], ...)")
+    assert len(reprstr) < 100
+
+    a = A("x" * 1000)
+    assert bounded_repr(a, max_length=20) == "A(a='xxxxx...xxxxx', ...)"
+
+    b = B(1, "y" * 1000)
+    assert bounded_repr(b, max_length=20) == "B<1, b=yyyyyyyyyyy...>"
+
+
+def test_max_length_plain_values():
+    """Test that values which don't use represent are limited by the budget
+    rather than the defaults of reprlib.
+    """
+    assert bounded_repr("x" * 1000, max_length=5000) == repr("x" * 1000)
+    assert bounded_repr(list(range(100)), max_length=5000) == repr(list(range(100)))
+    assert bounded_repr("x" * 1000, max_length=10) == "'xx...xxx'"
+
+    value = {i: [str(i) * 50] for i in range(100)}
+    assert bounded_repr(value, max_length=20000) == repr(value)
+    assert 5000 < len(bounded_repr(value, max_length=5000)) < 5100
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        list(range(500000)),
+        [list(range(100))] * 100,
+        {i: "x" * 50 for i in range(1000)},
+        ("y" * 1000,) * 10,
+    ],
+)
+def test_max_length_items(value):
+    """Test that each item of a container is limited by the budget left by
+    the previous items.
+    """
+    reprstr = bounded_repr(A(value), max_length=100)
+    assert reprstr.endswith(("...], ...)", "...), ...)", "...}, ...)"))
+    assert len(reprstr) < 130
+
+
+def test_max_length_skips_attributes():
+    class C:
+        def __init__(self, a, b):
+            self.a = a
+
+        @property
+        def b(self):
+            raise AssertionError("budget was spent, b should not be read")
+
+    C = autorepr(C)
+    assert bounded_repr(C("x" * 100, None), max_length=10) == "C(a='...', ...)"
+
+
+def test_cycle():
+    a = A(1)
+    a.b = [a]
+    assert bounded_repr(a) == "A(a=1, b=[...])"
+
+
+def test_autorepr_bounds():
+    @autorepr(max_length=20)
+    class C:
+        def __init__(self, a, b):
+            self.a = a
+            self.b = b
+
+    assert repr(C(1, 2)) == "C(a=1, b=2)"
+    assert repr(C("x" * 100, 2)) == "C(a='xxxxx...xxxxx', ...)"
+
+    @autorepr(max_depth=1)
+    class D:
+        def __init__(self, a):
+            self.a = a
+
+    assert repr(D(D(1))) == "D(a=D(...))"
+    # The limits of nested objects are those of the outermost object.
+    assert repr(A(D(D(1)))) == "A(a=D(a=D(...)), b=None)"
+
+
+def test_helper_mixin_bounds():
+    class C(B, max_length=20):
+        pass
+
+    assert repr(C(1, 2)) == "C<1, b=2>"
+    assert repr(C(1, "z" * 100)) == "C<1, b=zzzzzzzzzzz...>"
+
+
+def test_bounded_helper():
+    class C:
+        def __init__(self, a, b):
+            self.a = a
+            self.b = b
+
+        def __repr__(self):
+            r = BoundedReprHelper(self, max_length=15)
+            r.positional_from_attr("a")
+            r.keyword_from_attr("b")
+            return str(r)
+
+    assert repr(C(1, 2)) == "C(1, b=2)"
+    assert repr(C("x" * 50, 2)) == "C('xxx...xxxx', ...)"
+
+    class D(C):
+        def __repr__(self):
+            r = BoundedReprHelper(self)
+            r.keyword_from_attr("a")
+            r.positional_from_attr("b")
+            raise RuntimeError("unreachable")  # pragma: no cover
+
+    with pytest.raises(ValueError):
+        repr(D(1, 2))
+
+
+def test_bounded_helper_reset():
+    r = BoundedReprHelper(A(1), max_length=15)
+    reprs = []
+    for obj in [A("x" * 50), A(2)]:
+        r.reset(obj)
+        r.keyword_from_attr("a")
+        r.keyword_from_attr("b")
+        reprs.append(str(r))
+    assert reprs == ["A(a='xx...xxx', ...)", "A(a=2, b=None)"]
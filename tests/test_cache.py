@@ -0,0 +1,216 @@
+import copy
+import gc
+import pickle
+from datetime import date
+
+from represent import (
+    ReprHelperMixin,
+    autorepr,
+    clear_repr_cache,
+    register_formatter,
+    unregister_formatter,
+)
+from represent import cache as cache_module
+
+
+def counting_autorepr(**kwargs):
+    """Decorate a class whose attribute reads are counted."""
+
+    def decorate(cls):
+        cls.reads = 0
+
+        def get_a(self):
+            type(self).reads += 1
+            return self._a
+
+        cls.a = property(get_a)
+        return autorepr(**kwargs)(cls)
+
+    return decorate
+
+
+def test_autorepr_cache():
+    @counting_autorepr(cache=True)
+    class A:
+        def __init__(self, a):
+            self._a = a
+
+    a = A([1, 2])
+    assert repr(a) == "A(a=[1, 2])"
+    assert repr(a) == "A(a=[1, 2])"
+    assert repr([a]) == "[A(a=[1, 2])]"
+    assert A.reads == 1
+
+    a._a = "changed"
+    assert repr(a) == "A(a=[1, 2])"
+    clear_repr_cache(a)
+    assert repr(a) == "A(a='changed')"
+    assert A.reads == 2
+
+    # Separate instances are cached separately
+    assert repr(A(3)) == "A(a=3)"
+
+    clear_repr_cache()
+    assert repr(a) == "A(a='changed')"
+    assert A.reads == 4
+
+
+def test_cache_released():
+    @autorepr(cache=True)
+    class A:
+        def __init__(self, a):
+            self.a = a
+
+    a = A(1)
+    repr(a)
+    key = id(a)
+    assert key in cache_module._cache
+    del a
+    gc.collect()
+    assert key not in cache_module._cache
+
+
+def test_cache_slots():
+    @autorepr(cache=True)
+    class A:
+        __slots__ = ("a", "__weakref__")
+
+        def __init__(self, a):
+            self.a = a
+
+    assert repr(A(1)) == "A(a=1)"
+
+    class B:
+        __slots__ = ("a", "__dict__")
+
+        def __init__(self, a):
+            self.a = a
+
+    B = autorepr(cache=True)(B)
+    b = B(1)
+    assert repr(b) == "B(a=1)"
+    assert vars(b) == {}
+    b.a = 2
+    assert repr(b) == "B(a=1)"
+    clear_repr_cache(b)
+    assert repr(b) == "B(a=2)"
+
+    @autorepr(cache=True)
+    class C:
+        __slots__ = ("a",)
+
+        def __init__(self, a):
+            self.a = a
+
+    c = C(1)
+    assert repr(c) == "C(a=1)"
+    c.a = 2
+    assert repr(c) == "C(a=1)"
+    clear_repr_cache(c)
+    assert repr(c) == "C(a=2)"
+    assert repr(C(3)) == "C(a=3)"
+
+
+@autorepr(cache=True)
+class A:
+    # Without __weakref__, so the repr can't be cached by weak reference.
+    __slots__ = ("__dict__",)
+
+    def __init__(self, a):
+        self.a = a
+
+    def __eq__(self, other):
+        return vars(self) == vars(other)
+
+
+def test_cache_instance_state():
+    """Test that the cache doesn't change the state of instances."""
+    a = A(1)
+    assert repr(a) == "A(a=1)"
+    assert vars(a) == {"a": 1}
+    assert a == A(1)
+    assert vars(pickle.loads(pickle.dumps(a))) == {"a": 1}
+
+    a2 = copy.copy(a)
+    a2.a = 2
+    assert repr(a2) == "A(a=2)"
+
+
+def test_cache_formatters():
+    @autorepr(cache=True)
+    class A:
+        def __init__(self, a):
+            self.a = a
+
+    a = A(date(2020, 1, 2))
+    assert repr(a) == "A(a=datetime.date(2020, 1, 2))"
+    register_formatter(date, lambda d: f"<{d.isoformat()}>")
+    try:
+        assert repr(a) == "A(a=<2020-01-02>)"
+    finally:
+        unregister_formatter(date)
+    assert repr(a) == "A(a=datetime.date(2020, 1, 2))"
+
+
+def test_cache_slots_evicted(monkeypatch):
+    monkeypatch.setattr(cache_module, "_STRONG_CACHE_SIZE", 2)
+
+    @autorepr(cache=True)
+    class A:
+        __slots__ = ("a",)
+
+        def __init__(self, a):
+            self.a = a
+
+    objs = [A(i) for i in range(3)]
+    for obj in objs:
+        repr(obj)
+    # The oldest entry is released
+    assert list(cache_module._strong_cache) == [id(objs[1]), id(objs[2])]
+
+    objs[2].a = "changed"
+    assert repr(objs[2]) == "A(a=2)"
+    clear_repr_cache(objs[2])
+    assert list(cache_module._strong_cache) == [id(objs[1])]
+    assert repr(objs[2]) == "A(a='changed')"
+    clear_repr_cache()
+    assert not cache_module._strong_cache
+
+
+def test_cache_recursion():
+    @autorepr(cache=True)
+    class A:
+        def __init__(self, a=None):
+            self.a = a
+
+    a = A()
+    b = A(a)
+    a.a = b
+    assert repr(a) == "A(a=A(a=...))"
+    # b was visited during the repr of a, but its repr would be different
+    assert repr(b) == "A(a=A(a=...))"
+    assert id(b) not in cache_module._cache
+
+
+def test_helper_mixin_cache():
+    class A(ReprHelperMixin, cache=True):
+        def __init__(self, a):
+            self.a = a
+
+        def _repr_helper_(self, r):
+            r.keyword_from_attr("a")
+
+    class B(A, trace=True, max_length=20):
+        pass
+
+    a = A(1)
+    assert repr(a) == "A(a=1)"
+    a.a = 2
+    assert repr(a) == "A(a=1)"
+    clear_repr_cache(a)
+    assert repr(a) == "A(a=2)"
+
+    b = B("x" * 100)
+    assert repr(b) == "B(a='xxxxx...xxxxx')"
+    b.a = 1
+    assert repr(b) == "B(a='xxxxx...xxxxx')"
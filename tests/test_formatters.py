@@ -0,0 +1,134 @@
+from abc import ABC
+from collections.abc import Mapping
+from datetime import date, datetime
+from fractions import Fraction
+from numbers import Number
+
+import pytest
+from IPython.lib.pretty import pretty
+from rich.pretty import pretty_repr
+
+from represent import (
+    ReprHelper,
+    ReprHelperMixin,
+    autorepr,
+    bounded_repr,
+    register_formatter,
+    unregister_formatter,
+)
+
+
+@autorepr
+class A:
+    def __init__(self, a, b=None):
+        self.a = a
+        self.b = b
+
+
+class B(ReprHelperMixin):
+    def __init__(self, a):
+        self.a = a
+
+    def _repr_helper_(self, r):
+        r.positional_from_attr("a")
+
+
+class C(B, trace=True):
+    pass
+
+
+@pytest.fixture
+def format_date():
+    register_formatter(date, lambda d: f"<{d.isoformat()}>")
+    yield
+    unregister_formatter(date)
+
+
+def test_formatter():
+    a = A(1, date(2020, 1, 2))
+    b = B(date(2020, 1, 2))
+    c = C(datetime(2020, 1, 2))
+    # Compile the methods before registering the formatter.
+    assert repr(a) == "A(a=1, b=datetime.date(2020, 1, 2))"
+    assert repr(c) == "C(datetime.datetime(2020, 1, 2, 0, 0))"
+
+    @register_formatter(date)
+    def format_date(d):
+        return f"<{d.isoformat()}>"
+
+    try:
+        assert repr(a) == "A(a=1, b=<2020-01-02>)"
+        assert pretty(a) == "A(a=1, b=<2020-01-02>)"
+        assert pretty_repr(a) == "A(a=1, b=<2020-01-02>)"
+        assert repr(b) == "B(<2020-01-02>)"
+        assert pretty(b) == "B(<2020-01-02>)"
+        assert pretty_repr(b) == "B(<2020-01-02>)"
+        # Subclasses use the formatter of their base class.
+        assert repr(c) == "C(<2020-01-02T00:00:00>)"
+        assert pretty(c) == "C(<2020-01-02T00:00:00>)"
+        assert pretty_repr(c) == "C(<2020-01-02T00:00:00>)"
+    finally:
+        unregister_formatter(date)
+
+    assert repr(a) == "A(a=1, b=datetime.date(2020, 1, 2))"
+    assert repr(c) == "C(datetime.datetime(2020, 1, 2, 0, 0))"
+
+
+def test_formatter_atomic():
+    a = A(1, "x")
+    assert repr(a) == "A(a=1, b='x')"
+    register_formatter(int, hex)
+    try:
+        assert repr(a) == "A(a=0x1, b='x')"
+        assert pretty(a) == "A(a=0x1, b='x')"
+        assert repr(A(True)) == "A(a=0x1, b=None)"
+    finally:
+        unregister_formatter(int)
+    assert repr(a) == "A(a=1, b='x')"
+
+
+def test_formatter_abc():
+    a = A(1, {"k": 2.5})
+    register_formatter(Number, lambda n: f"<{n}>")
+    register_formatter(Mapping, lambda m: f"<{len(m)} items>")
+    try:
+        assert repr(a) == "A(a=<1>, b=<1 items>)"
+        assert repr(A(Fraction(1, 2))) == "A(a=<1/2>, b=None)"
+    finally:
+        unregister_formatter(Number)
+        unregister_formatter(Mapping)
+    assert repr(a) == "A(a=1, b={'k': 2.5})"
+
+
+def test_formatter_abc_virtual_subclass():
+    class Shape(ABC):
+        pass
+
+    class Square:
+        def __repr__(self):
+            return "Square()"
+
+    register_formatter(Shape, lambda shape: "<shape>")
+    try:
+        assert repr(A(Square())) == "A(a=Square(), b=None)"
+        Shape.register(Square)
+        assert repr(A(Square())) == "A(a=<shape>, b=None)"
+    finally:
+        unregister_formatter(Shape)
+
+
+def test_formatter_nested(format_date):
+    a = A([date(2020, 1, 2)], {"k": (date(2021, 1, 1),)})
+    assert repr(a) == "A(a=[<2020-01-02>], b={'k': (<2021-01-01>,)})"
+    assert bounded_repr(a) == "A(a=[<2020-01-02>], b={'k': (<2021-01-01>,)})"
+
+
+def test_formatter_helper(format_date):
+    class D:
+        def __repr__(self):
+            r = ReprHelper(self)
+            r.positional_with_value(date(2020, 1, 2))
+            r.keyword_with_value("raw", "date", raw=True)
+            return str(r)
+
+    assert repr(D()) == "D(<2020-01-02>, raw=date)"
@@ -273,7 +273,7 @@ def test_helper_mixin():
 
 
 def test_helper_mixin_recursive():
-    """Test that the mixin applies the :func:`reprlib.recursive_repr` decorator."""
+    """Test that the mixin shows recursive references as ``...``."""
 
     class A(ReprHelperMixin):
         def __init__(self, a=None):
@@ -312,3 +312,237 @@ def test_helper_parantheses():
     assert repr(r.parantheses) == "Parantheses(left='(', right=')')"
     r.parantheses = ("<", ">")
     assert repr(r.parantheses) == "Parantheses(left='<', right='>')"
+
+
+def test_helper_mixin_trace():
+    class A(ReprHelperMixin, trace=True):
+        def __init__(self, a, b):
+            self.a = a
+            self._b = b
+
+        def _repr_helper_(self, r):
+            r.positional_from_attr("a")
+            r.keyword_from_attr("b", "_b")
+
+    a = A("x", [1, 2])
+    assert A._represent.args == ["a"]
+    assert A._represent.kw == [("b", "_b")]
+    assert repr(a) == "A('x', b=[1, 2])"
+    assert pretty(a) == "A('x', b=[1, 2])"
+    assert pretty_repr(a) == "A('x', b=[1, 2])"
+
+    a.a = a
+    assert repr(a) == "A(..., b=[1, 2])"
+    assert pretty(a) == "A(A(...), b=[1, 2])"
+
+    class B(A):
+        def _repr_helper_(self, r):
+            r.parantheses = ("<", ">")
+            r.keyword_from_attr("a")
+
+    assert B._represent.kw == [("a", "a")]
+    assert repr(B(1, 2)) == "B<a=1>"
+    assert pretty(B(1, 2)) == "B<a=1>"
+
+    class C(A):
+        def _repr_helper_(self, r):
+            r.parantheses = ("{", "}")
+            r.keyword_from_attr("a")
+
+    assert repr(C(1, 2)) == "C{a=1}"
+    assert repr(C([1], 2)) == "C{a=[1]}"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        # Values read from self
+        lambda self, r: r.keyword_with_value("a", self.a),
+        lambda self, r: r.positional_with_value(1),
+        # Branching
+        lambda self, r: r.keyword_from_attr("a") if self.a else None,
+        # Positional argument after keyword argument
+        lambda self, r: (r.keyword_from_attr("a"), r.positional_from_attr("a")),
+    ],
+)
+def test_helper_mixin_trace_fallback(body):
+    class A(ReprHelperMixin, trace=True):
+        def __init__(self, a):
+            self.a = a
+
+        _repr_helper_ = body
+
+    assert A._represent is None
+    assert A.__repr__ is ReprHelperMixin.__repr__
+    assert A._repr_pretty_ is ReprHelperMixin._repr_pretty_
+    assert A.__rich_repr__ is ReprHelperMixin.__rich_repr__
+
+
+def test_helper_mixin_trace_inheritance():
+    class A(ReprHelperMixin, trace=True):
+        def __init__(self, a):
+            self.a = a
+
+        def _repr_helper_(self, r):
+            r.keyword_from_attr("a")
+
+    class B(A, trace=False):
+        pass
+
+    class C(A):
+        def __repr__(self):
+            return "custom"
+
+    class D(C):
+        pass
+
+    assert B.__repr__ is ReprHelperMixin.__repr__
+    assert repr(B(1)) == "B(a=1)"
+    assert repr(C(1)) == "custom"
+    assert repr(D(1)) == "custom"
+    assert pretty(D(1)) == "D(a=1)"
+
+
+def test_helper_mixin_repr_into():
+    class A(ReprHelperMixin):
+        def __init__(self, a, b):
+            self.a = a
+            self.b = b
+
+        def _repr_helper_(self, r):
+            r.positional_from_attr("a")
+            r.keyword_with_value("b", self.b)
+
+    a = A(A(1, "x"), [A(2, None)])
+    buffer = []
+    a.__repr_into__(buffer)
+    assert "".join(buffer) == repr(a) == "A(A(1, b='x'), b=[A(2, b=None)])"
+    assert buffer[:3] == ["A(", "A(", "1"]
+
+
+def test_helper_slots():
+    class A:
+        def __init__(self, a):
+            self.a = a
+
+    for r in [ReprHelper(A(1)), RichReprHelper(A(1))]:
+        assert not hasattr(r, "__dict__")
+        with pytest.raises(AttributeError):
+            r.unknown = 1
+
+    # The default parantheses are shared
+    assert ReprHelper(A(1)).parantheses is ReprHelper(A(2)).parantheses
+
+
+def test_helper_reset():
+    class A:
+        def __init__(self, a):
+            self.a = a
+
+        def _repr_helper_(self, r):
+            r.keyword_from_attr("a")
+
+    objects = [A(1), A("b"), A([3])]
+    r = ReprHelper(objects[0])
+    r.parantheses = ("<", ">")
+    reprs = []
+    for obj in objects:
+        r.reset(obj)
+        obj._repr_helper_(r)
+        reprs.append(str(r))
+    assert reprs == ["A(a=1)", "A(a='b')", "A(a=[3])"]
+
+    r = RichReprHelper(objects[0])
+    results = []
+    for obj in objects:
+        r.reset(obj)
+        obj._repr_helper_(r)
+        results.append(list(r))
+    assert results == [[("a", 1)], [("a", "b")], [("a", [3])]]
+
+
+class _Broken:
+    def __repr__(self):
+        raise RuntimeError
+
+
+def test_helper_safe():
+    class A:
+        loads = 0
+
+        def __init__(self, a, b):
+            self.a = a
+            self._b = b
+
+        @property
+        def b(self):
+            A.loads += 1
+            return self._b
+
+        def _repr_helper_(self, r):
+            r.positional_from_attr("a")
+            r.keyword_from_attr("b")
+            r.keyword_with_value("c", [1])
+
+        def __repr__(self):
+            r = ReprHelper(self, safe=True)
+            self._repr_helper_(r)
+            return str(r)
+
+        def _repr_pretty_(self, p, cycle):
+            with PrettyReprHelper(self, p, cycle, safe=True) as r:
+                self._repr_helper_(r)
+
+        def __rich_repr__(self):
+            r = RichReprHelper(self, safe=True)
+            self._repr_helper_(r)
+            yield from r
+
+    broken = _Broken()
+    obj = A(broken, 2)
+    expected = f"A({object.__repr__(broken)}, b=<not loaded>, c=[1])"
+    assert repr(obj) == expected
+    assert pretty(obj) == expected
+    assert "b=<not loaded>" in pretty_repr(obj)
+    assert A.loads == 0
+
+    # Without safe, the property is called
+    ReprHelper(obj).keyword_from_attr("b")
+    assert A.loads == 1
+
+
+def test_helper_mixin_safe():
+    class A(ReprHelperMixin, safe=True):
+        __slots__ = ("a", "b")
+
+        def __init__(self, a):
+            self.a = a
+
+        def _repr_helper_(self, r):
+            r.keyword_from_attr("a")
+            r.keyword_from_attr("b")
+
+    class B(A, trace=True):
+        __slots__ = ()
+
+    class C(A, trace=True):
+        __slots__ = ()
+
+        # Can't be traced
+        def _repr_helper_(self, r):
+            if self.a:
+                super()._repr_helper_(r)
+
+    broken = _Broken()
+    for cls in [A, B, C]:
+        obj = cls(broken)
+        expected = f"{cls.__name__}(a={object.__repr__(broken)}, b=<not loaded>)"
+        assert repr(obj) == expected
+        assert pretty(obj) == expected
+        assert "b=<not loaded>" in pretty_repr(obj)
+
+    class D(A, safe=False):
+        __slots__ = ()
+
+    with pytest.raises(AttributeError):
+        repr(D(1))
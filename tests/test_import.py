@@ -0,0 +1,83 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import represent
+
+MODULES = [
+    "arrays",
+    "bounded",
+    "cache",
+    "core",
+    "formatters",
+    "helper",
+    "instrumentation",
+    "keys",
+    "log",
+    "output",
+    "parallel",
+    "structured",
+]
+
+
+def test_all():
+    assert represent.__all__ == [
+        "ReprHelperMixin",
+        "autorepr",
+        "ReprHelper",
+        "PrettyReprHelper",
+        "RichReprHelper",
+    ]
+
+    names = []
+    for module in MODULES:
+        names.extend(importlib.import_module(f"represent.{module}").__all__)
+    assert set(represent.__all__) <= set(names) <= set(dir(represent))
+
+    for name in names:
+        assert getattr(represent, name).__name__ == name
+
+    with pytest.raises(AttributeError):
+        represent.missing
+
+
+@pytest.mark.parametrize("module", [*MODULES, "utilities"])
+def test_submodule_attributes(module):
+    """Test that submodules can be used as attributes of the package without
+    importing them first.
+    """
+    code = f"""if True:
+        import represent
+        print(represent.{module}.__name__)
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == f"represent.{module}"
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import represent",
+        "from represent import autorepr",
+        "from represent import ReprHelperMixin",
+        "from represent import autorepr; autorepr(type('A', (), {'__init__': f}))",
+    ],
+)
+def test_lazy_imports(statement):
+    """Test that slow modules aren't imported until they are needed."""
+    code = f"""if True:
+        import sys
+        def f(self, a):
+            pass
+        {statement}
+        slow = ["inspect", "logging", "multiprocessing", "concurrent.futures", "numpy"]
+        print(*[name for name in slow if name in sys.modules])
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == []
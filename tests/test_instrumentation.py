@@ -0,0 +1,143 @@
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from IPython.lib.pretty import pretty
+from rich.pretty import pretty_repr
+
+from represent import (
+    ReprHelperMixin,
+    autorepr,
+    disable_stats,
+    enable_stats,
+    reset_stats,
+    stats,
+)
+
+
+@pytest.fixture
+def recording():
+    reset_stats()
+    enable_stats()
+    yield
+    disable_stats()
+    reset_stats()
+
+
+@autorepr
+class A:
+    def __init__(self, a):
+        self.a = a
+
+
+class B(ReprHelperMixin):
+    def __init__(self, b):
+        self.b = b
+
+    def _repr_helper_(self, r):
+        r.keyword_from_attr("b")
+
+
+class C(B, trace=True):
+    pass
+
+
+def test_stats(recording):
+    @autorepr
+    class D:
+        def __init__(self, d):
+            self.d = d
+
+    assert repr(A(1)) == "A(a=1)"
+    assert repr(A(B(2))) == "A(a=B(b=2))"
+    assert repr(B(1)) == "B(b=1)"
+    assert repr(C(1)) == "C(b=1)"
+    assert repr(D(1)) == "D(d=1)"
+    assert pretty(A(1)) == "A(a=1)"
+    assert pretty_repr(B(1)) == "B(b=1)"
+
+    result = stats()
+    assert result[A].repr_calls == 2
+    assert result[A].repr_length == len("A(a=1)") + len("A(a=B(b=2))")
+    assert result[A].repr_time > 0
+    assert result[A].pretty_calls == 1
+    assert result[B].repr_calls == 1
+    assert result[B].rich_calls == 1
+    assert result[C].repr_calls == 1
+    assert result[D].repr_calls == 1
+
+    disable_stats()
+    repr(A(1))
+    assert stats()[A].repr_calls == 2
+    assert not hasattr(A.__repr__, "_represent_instrumented")
+
+    reset_stats()
+    assert stats() == {}
+
+
+def test_stats_trace_fallback(recording):
+    """Test that methods of classes which fall back to the methods of
+    ReprHelperMixin are only instrumented once.
+    """
+    repr(B(1))
+
+    class D(ReprHelperMixin, trace=True):
+        def __init__(self, d):
+            self.d = d
+
+        def _repr_helper_(self, r):
+            if self.d:
+                r.keyword_from_attr("d")
+
+    assert repr(D(1)) == "D(d=1)"
+    assert stats()[D].repr_calls == 1
+    assert stats()[D].repr_length == len("D(d=1)")
+
+    disable_stats()
+    repr(D(1))
+    assert stats()[D].repr_calls == 1
+    assert not hasattr(D.__repr__, "_represent_instrumented")
+    assert D.__repr__ is ReprHelperMixin.__repr__
+
+
+def test_stats_threads(recording):
+    def work(i):
+        for _ in range(1000):
+            repr(A(i))
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(work, range(8)))
+
+    assert stats()[A].repr_calls == 8000
+
+
+def test_stats_disabled():
+    reset_stats()
+    repr(A(1))
+    assert stats() == {}
+    assert not hasattr(A.__repr__, "_represent_instrumented")
+    assert not hasattr(B.__repr__, "_represent_instrumented")
+
+
+def test_stats_environment_variable():
+    code = """if True:
+        from represent import autorepr, stats
+
+        @autorepr
+        class A:
+            def __init__(self, a):
+                self.a = a
+
+        repr(A(1))
+        print(stats()[A].repr_calls)
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "REPRESENT_STATS": "1"},
+    )
+    assert result.stdout.strip() == "1"
@@ -0,0 +1,93 @@
+import hashlib
+
+import pytest
+
+from represent import ReprHelperMixin, autorepr, fingerprint, key, utilities
+
+
+@autorepr(positional=1)
+class A:
+    def __init__(self, a, b=None):
+        self.a = a
+        self.b = b
+
+
+class B(ReprHelperMixin):
+    def __init__(self, a, b=None):
+        self.a = a
+        self.b = b
+
+    def _repr_helper_(self, r):
+        r.positional_from_attr("a")
+        if self.b is not None:
+            r.keyword_from_attr("b")
+
+
+class C(ReprHelperMixin, trace=True):
+    def __init__(self, c):
+        self.c = c
+
+    def _repr_helper_(self, r):
+        r.keyword_from_attr("c")
+
+
+VALUES = [
+    A(1),
+    A(1.0),
+    A(True),
+    A("1"),
+    A(1, b=[1, 2]),
+    A(1, b=(1, 2)),
+    A(1, b={"x": A(2)}),
+    A(1, b={1, 2}),
+    A(None, b=A(None)),
+    B(1, None),
+    B(1, 2),
+    C(1),
+    C([A(1)]),
+    [A(1)],
+]
+
+
+def test_key():
+    keys = [key(value) for value in VALUES]
+    # Objects with different reprs have different keys...
+    assert len(set(keys)) == len(VALUES)
+    # ...and equal reprs give equal keys.
+    rebuilt = [key(eval(repr(value))) for value in VALUES]
+    assert rebuilt == keys
+
+    assert key(A(1, b=[1])) == (A, (int, 1), (list, (int, 1)))
+    assert key(B(1, 2)) == (B, (tuple, "a", (int, 1)), (tuple, "b", (int, 2)))
+
+
+def test_key_unhashable():
+    class D:
+        __hash__ = None
+
+        def __repr__(self):
+            return "D()"
+
+    assert key(A(D())) == (A, (D, "D()"), None)
+    hash(key(A(D())))
+
+
+def test_key_recursive():
+    a = A(1)
+    a.b = [a]
+    assert key(a) == (A, (int, 1), (list, ...))
+    hash(key(a))
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_fingerprint(value):
+    expected = hashlib.sha256(repr(value).encode()).hexdigest()
+    assert fingerprint(value) == expected
+    assert fingerprint(value, "md5") == hashlib.md5(repr(value).encode()).hexdigest()
+
+
+def test_fingerprint_chunks(monkeypatch):
+    monkeypatch.setattr(utilities, "_CHUNK_SIZE", 8)
+    value = A("x" * 20, b=[A(i) for i in range(10)])
+    expected = hashlib.sha256(repr(value).encode()).hexdigest()
+    assert fingerprint(value) == expected
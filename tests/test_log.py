@@ -0,0 +1,89 @@
+import logging
+
+from represent import LazyReprFilter, autorepr, lazy
+
+
+@autorepr
+class A:
+    calls = 0
+
+    def __init__(self, a):
+        self._a = a
+
+    @property
+    def a(self):
+        type(self).calls += 1
+        return self._a
+
+    def __str__(self):
+        return "str of A"
+
+
+def test_lazy():
+    a = A("x" * 100)
+    wrapped = lazy(a)
+    assert A.calls == 0
+    assert str(wrapped) == repr(wrapped) == repr(a)
+    assert f"{wrapped:.4}" == "A(a="
+
+    assert repr(lazy(a, max_length=10)) == "A(a='...')"
+    assert repr(lazy(A(A(1)), max_depth=1)) == "A(a=A(...))"
+
+
+def test_lazy_logging(caplog):
+    logger = logging.getLogger("represent.test_lazy")
+    A.calls = 0
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        logger.debug("discarded %s", lazy(A(1)))
+        assert A.calls == 0
+
+        logger.info("emitted %s", lazy(A(1)))
+        assert A.calls > 0
+
+    assert caplog.messages == ["emitted A(a=1)"]
+
+
+@autorepr
+class B:
+    def __init__(self, b):
+        self.b = b
+
+
+def test_filter(caplog):
+    logger = logging.getLogger("represent.test_filter")
+    log_filter = LazyReprFilter(max_length=10)
+    logger.addFilter(log_filter)
+
+    try:
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            logger.info("%s %r %s", B("x" * 100), A("x" * 100), "y" * 20)
+            # A defines __str__
+            logger.info("%s", A("x" * 100))
+            logger.info("%(b)s", {"b": B(1)})
+            logger.info("no args")
+    finally:
+        logger.removeFilter(log_filter)
+
+    assert caplog.messages == [
+        "B(b='...') A(a='...') " + "y" * 20,
+        "str of A",
+        "B(b=1)",
+        "no args",
+    ]
+
+
+def test_filter_unbounded(caplog):
+    logger = logging.getLogger("represent.test_filter_unbounded")
+    log_filter = LazyReprFilter()
+    logger.addFilter(log_filter)
+
+    try:
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            b = B(1)
+            logger.info("%s", b)
+    finally:
+        logger.removeFilter(log_filter)
+
+    assert caplog.records[0].args == (b,)
+    assert caplog.messages == ["B(b=1)"]
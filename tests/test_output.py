@@ -0,0 +1,171 @@
+import io
+from datetime import date
+
+import pytest
+
+from represent import (
+    ReprHelper,
+    ReprHelperMixin,
+    autorepr,
+    register_formatter,
+    repr_bytes,
+    repr_bytes_into,
+    repr_many,
+    unregister_formatter,
+    utilities,
+    write_repr,
+    write_repr_bytes,
+)
+
+
+class RecordingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, s):
+        self.writes.append(s)
+        if isinstance(s, bytes):
+            return len(s)
+        return super().write(s)
+
+
+@autorepr
+class A:
+    def __init__(self, a, b=None):
+        self.a = a
+        self.b = b
+
+
+class B(ReprHelperMixin):
+    def __init__(self, a):
+        self.a = a
+
+    def _repr_helper_(self, r):
+        r.positional_from_attr("a")
+
+
+def test_write_repr():
+    obj = A([A(1), B(A(2))], "x")
+    stream = RecordingStream()
+    write_repr(obj, stream)
+    assert stream.getvalue() == repr(obj)
+    assert stream.getvalue() == "A(a=[A(a=1, b=None), B(A(a=2, b=None))], b='x')"
+    # Written in parts rather than as one string. Objects with atomic
+    # attributes are formatted in one go.
+    assert stream.writes[:4] == ["A(a=", "[", "A(a=1, b=None)", ", "]
+
+
+def test_write_repr_other():
+    stream = io.StringIO()
+    write_repr({"a": [1, 2]}, stream)
+    assert stream.getvalue() == "{'a': [1, 2]}"
+
+
+def test_helper_write_to():
+    class C:
+        def __init__(self, a, b):
+            self.a = a
+            self.b = b
+
+        def _repr_helper(self, r):
+            r.parantheses = ("<", ">")
+            r.positional_from_attr("a")
+            r.keyword_from_attr("b")
+
+        def __repr__(self):
+            r = ReprHelper(self)
+            self._repr_helper(r)
+            return str(r)
+
+        def write_repr(self, stream):
+            r = ReprHelper(self)
+            self._repr_helper(r)
+            r.write_to(stream)
+
+    c = C(1, A(2))
+    stream = RecordingStream()
+    c.write_repr(stream)
+    assert stream.getvalue() == repr(c) == "C<1, b=A(a=2, b=None)>"
+    assert len(stream.writes) > 1
+
+    r = ReprHelper(c)
+    c._repr_helper(r)
+    assert bytes(r) == b"C<1, b=A(a=2, b=None)>"
+
+
+def test_repr_many():
+    objs = [A(1), B(2), A([B(3)]), 4, [A(5)], B(6)]
+    assert repr_many(objs) == repr(objs)[1:-1]
+    assert repr_many(iter(objs), sep="\n") == "\n".join(map(repr, objs))
+    assert repr_many([]) == ""
+
+    a = A(1)
+    a.b = a
+    assert repr_many([a, a]) == "A(a=1, b=...), A(a=1, b=...)"
+
+
+def test_repr_many_classes():
+    class C(A):
+        def __repr__(self):
+            return "C()"
+
+    class D(B):
+        pass
+
+    objs = [A(1), A(2, [3]), A({4: A(5)}), C(6), D(7), D(A(8)), B(9)]
+    assert repr_many(objs) == repr(objs)[1:-1]
+
+    # Formatters registered after the first call are used.
+    repr_many([A(date(2020, 1, 2))])
+    register_formatter(date, lambda d: f"<{d.isoformat()}>")
+    try:
+        assert (
+            repr_many([A(date(2020, 1, 2)), B(1)]) == "A(a=<2020-01-02>, b=None), B(1)"
+        )
+    finally:
+        unregister_formatter(date)
+    assert repr_many([A(date(2020, 1, 2))]) == "A(a=datetime.date(2020, 1, 2), b=None)"
+
+
+def test_repr_bytes(monkeypatch):
+    obj = A([A("é"), B(A(2))], "x" * 20)
+    expected = repr(obj).encode()
+    assert repr_bytes(obj) == expected
+    assert repr_bytes(obj, "ascii") == repr(obj).encode("ascii", "backslashreplace")
+    assert repr_bytes({"a": 1}) == b"{'a': 1}"
+
+    # Written in several chunks
+    monkeypatch.setattr(utilities, "_CHUNK_SIZE", 8)
+    stream = RecordingStream()
+    write_repr_bytes(obj, stream)
+    assert b"".join(stream.writes) == expected
+    assert len(stream.writes) > 1
+
+
+def test_repr_bytes_into():
+    obj = A([A("é"), B(A(2))], "x" * 20)
+    expected = repr(obj).encode()
+
+    data = bytearray(b"prefix:")
+    assert repr_bytes_into(obj, data, len(data)) == len(expected)
+    assert data == b"prefix:" + expected
+
+    memory = bytearray(100)
+    n = repr_bytes_into(obj, memoryview(memory), 2)
+    assert n == len(expected)
+    assert memory[2 : 2 + n] == expected
+    assert memory[:2] == bytes(2)
+    assert not any(memory[2 + n :])
+
+    small = bytearray(10)
+    with pytest.raises(ValueError, match="doesn't fit"):
+        repr_bytes_into(obj, memoryview(small))
+    assert small == bytes(10)
+
+    for offset in [-1, 11]:
+        with pytest.raises(ValueError, match="outside buffer"):
+            repr_bytes_into(obj, small, offset)
+        with pytest.raises(ValueError, match="outside buffer"):
+            repr_bytes_into(obj, memoryview(small), offset)
+    assert small == bytes(10)
@@ -0,0 +1,88 @@
+import io
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+from multiprocessing import get_context
+
+import pytest
+
+from represent import (
+    autorepr,
+    parallel,
+    register_formatter,
+    unregister_formatter,
+    write_repr_parallel,
+)
+
+
+@autorepr
+class A:
+    def __init__(self, a, b=None):
+        self.a = a
+        self.b = b
+
+
+def objects(n):
+    for i in range(n):
+        yield A(i, [A(str(i))] if i % 3 else None)
+
+
+@pytest.mark.parametrize("threads", [False, True])
+def test_write_repr_parallel(threads):
+    stream = io.StringIO()
+    write_repr_parallel(
+        objects(100), stream, sep="\n", chunksize=7, threads=threads, max_workers=2
+    )
+    assert stream.getvalue() == "\n".join(map(repr, objects(100)))
+
+
+def format_date(d):
+    return f"<{d.isoformat()}>"
+
+
+class SpawnProcessPoolExecutor(ProcessPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, mp_context=get_context("spawn"), **kwargs)
+
+
+@pytest.mark.parametrize("pass_executor", [False, True])
+def test_write_repr_parallel_formatters(monkeypatch, pass_executor):
+    """Test that formatters are used by worker processes which weren't
+    forked from this one.
+    """
+    objs = [A(date(2020, 1, i)) for i in range(1, 11)]
+    stream = io.StringIO()
+
+    register_formatter(date, format_date)
+    try:
+        if pass_executor:
+            with SpawnProcessPoolExecutor(2) as executor:
+                write_repr_parallel(objs, stream, chunksize=3, executor=executor)
+        else:
+            monkeypatch.setattr(
+                parallel, "ProcessPoolExecutor", SpawnProcessPoolExecutor
+            )
+            write_repr_parallel(objs, stream, chunksize=3, max_workers=2)
+        expected = ", ".join(map(repr, objs))
+    finally:
+        unregister_formatter(date)
+
+    assert "A(a=<2020-01-01>, b=None)" in expected
+    assert stream.getvalue() == expected
+
+
+def test_write_repr_parallel_executor():
+    stream = io.StringIO()
+    with ThreadPoolExecutor(2) as executor:
+        write_repr_parallel(objects(10), stream, chunksize=3, executor=executor)
+        # The executor isn't shut down.
+        assert executor.submit(int).result() == 0
+    assert stream.getvalue() == ", ".join(map(repr, objects(10)))
+
+
+def test_write_repr_parallel_empty():
+    stream = io.StringIO()
+    write_repr_parallel([], stream, threads=True)
+    assert stream.getvalue() == ""
+
+    with pytest.raises(ValueError):
+        write_repr_parallel([], stream, chunksize=0)
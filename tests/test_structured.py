@@ -0,0 +1,107 @@
+import io
+import json
+
+import pytest
+
+from represent import (
+    DictReprHelper,
+    ReprHelperMixin,
+    autorepr,
+    json_default,
+    register_formatter,
+    to_dict,
+    unregister_formatter,
+    write_json_lines,
+)
+
+
+@autorepr(positional=1)
+class A:
+    def __init__(self, a, b=None):
+        self.a = a
+        self.b = b
+
+
+class B(ReprHelperMixin):
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+    def _repr_helper_(self, r):
+        r.positional_from_attr("a")
+        r.positional_with_value(self.a * 2)
+        if self.b is not None:
+            r.keyword_from_attr("b")
+        r.keyword_with_value("raw", "x", raw=True)
+
+
+class C(ReprHelperMixin, trace=True):
+    def __init__(self, c):
+        self._c = c
+
+    def _repr_helper_(self, r):
+        r.keyword_from_attr("c", "_c")
+
+
+@autorepr(safe=True)
+class D:
+    def __init__(self, d):
+        pass
+
+    @property
+    def d(self):
+        raise AssertionError
+
+
+def test_to_dict():
+    inner = A(2)
+    assert to_dict(A(1, b=inner)) == {"a": 1, "b": inner}
+    assert to_dict(B(1, None)) == {"a": 1, 1: 2, "raw": "x"}
+    assert to_dict(B(1, 3)) == {"a": 1, 1: 2, "b": 3, "raw": "x"}
+    assert to_dict(C(1)) == {"c": 1}
+    assert repr(to_dict(D(1))) == "{'d': <not loaded>}"
+
+    with pytest.raises(TypeError, match="doesn't use"):
+        to_dict(object())
+
+
+def test_dict_repr_helper():
+    b = B(1, 3)
+    r = DictReprHelper(b)
+    b._repr_helper_(r)
+    assert list(r) == [("a", 1), (1, 2), ("b", 3), ("raw", "x")]
+
+    r.reset(A(1))
+    r.keyword_from_attr("a")
+    assert list(r) == [("a", 1)]
+
+    with pytest.raises(ValueError):
+        r.positional_from_attr("a")
+
+
+def test_json_lines():
+    stream = io.StringIO()
+    write_json_lines([A(1, b=[A(2), {3}]), C("é"), B(1, None), 4], stream)
+    lines = stream.getvalue().splitlines()
+    assert lines[0] == (
+        '{"__class__":"A","a":1,"b":[{"__class__":"A","a":2,"b":null},[3]]}'
+    )
+    assert lines[1] == '{"__class__":"C","c":"é"}'
+    assert json.loads(lines[2]) == {"__class__": "B", "a": 1, "1": 2, "raw": "x"}
+    assert lines[3] == "4"
+
+
+def test_json_default():
+    class E:
+        def __repr__(self):
+            return "E()"
+
+    assert json.dumps(A(E()), default=json_default) == (
+        '{"__class__": "A", "a": "E()", "b": null}'
+    )
+
+    register_formatter(E, lambda e: "<E>")
+    try:
+        assert json_default(E()) == "<E>"
+    finally:
+        unregister_formatter(E)